@@ -1,7 +1,7 @@
 import re
 import operator
 from datetime import datetime
-from functools import reduce
+from functools import cache, reduce
 import logging
 
 from django.db import models
@@ -37,6 +37,30 @@ STRPTIME_PLACEHOLDERS = {
 def register_simple_modelfield(model_field):
     column_class = get_column_for_modelfield(model_field)
     COLUMN_CLASSES.insert(0, (column_class, [model_field]))
+    clear_column_class_cache()
+
+
+@cache
+def _get_column_class_for_field_class(field_class):
+    for ColumnClass, modelfield_classes in COLUMN_CLASSES:
+        if issubclass(field_class, tuple(modelfield_classes)):
+            return ColumnClass
+
+
+def clear_column_class_cache():
+    """
+    Forgets the registry lookups made so far.  Registering a column class does this automatically,
+    but code that edits ``COLUMN_CLASSES`` by hand must call it afterwards.
+    """
+    _get_column_class_for_field_class.cache_clear()
+
+
+@cache
+def _resolve_db_source(model, source):
+    try:
+        return resolve_orm_path(model, source)
+    except FieldDoesNotExist:
+        return None
 
 
 def get_column_for_modelfield(model_field):
@@ -48,9 +72,9 @@ def get_column_for_modelfield(model_field):
     # climb the 'pk' field chain until we have something real.
     while model_field.related_model:
         model_field = model_field.related_model._meta.pk
-    for ColumnClass, modelfield_classes in COLUMN_CLASSES:
-        if isinstance(model_field, tuple(modelfield_classes)):
-            return ColumnClass
+
+    # The registry is only scanned once for each field class until it changes.
+    return _get_column_class_for_field_class(model_field.__class__)
 
 
 def get_attribute_value(obj, bit):
@@ -74,6 +98,7 @@ class ColumnMetaclass(type):
             COLUMN_CLASSES.insert(0, (new_class, [new_class.model_field_class]))
             if new_class.handles_field_classes:
                 COLUMN_CLASSES.insert(0, (new_class, new_class.handles_field_classes))
+            clear_column_class_cache()
         return new_class
 
 
@@ -272,6 +297,9 @@ class Column(metaclass=ColumnMetaclass):
         # the search for the first non-database field should end.
         if hasattr(source, "__call__"):
             return None
+        if isinstance(source, str):
+            # Every request asks again for the same handful of paths, so each is only walked once
+            return _resolve_db_source(model, source)
         try:
             return resolve_orm_path(model, source)
         except FieldDoesNotExist:
@@ -1,4 +1,5 @@
 import re
+import sys
 import copy
 import operator
 from collections import OrderedDict
@@ -29,11 +30,15 @@ from .utils import (
     OPTION_NAME_MAP,
     MINIMUM_PAGE_LENGTH,
     contains_plural_field,
+    get_related_lookups,
     split_terms,
     resolve_orm_path,
 )
 from .cache import DEFAULT_CACHE_TYPE, cache_types, get_cache_key, cache_data, get_cached_data
 
+# Matches the client's "order[i][column]" sort declarations, capturing their priority index
+_SORT_DECLARATION_RE = re.compile(r"^order\[(\d+)\]\[column\]$")
+
 
 def pretty_name(name):
     if not name:
@@ -136,6 +141,11 @@ class DatatableOptions(object):
         self.id = getattr(options, "id", "")
         self.model = getattr(options, "model", None)
         self.columns = getattr(options, "columns", None)  # table headers
+        if self.columns is not None:
+            # Shared by every Datatable built from these options, so keep it immutable
+            self.columns = tuple(
+                sys.intern(name) if isinstance(name, str) else name for name in self.columns
+            )
         self.exclude = getattr(options, "exclude", None)
         self.search_fields = getattr(options, "search_fields", None)  # extra searchable ORM fields
         self.unsortable_columns = getattr(options, "unsortable_columns", None)
@@ -152,6 +162,7 @@ class DatatableOptions(object):
         # Non-mutable; server behavior customization
         self.cache_type = getattr(options, "cache_type", cache_types.NONE)
         self.cache_queryset_count = getattr(options, "cache_queryset_count", False)
+        self.auto_select_related = getattr(options, "auto_select_related", False)
 
         # Mutable by the request
         self.ordering = getattr(options, "ordering", None)  # override to Model._meta.ordering
@@ -288,7 +299,8 @@ class Datatable(metaclass=DatatableMetaclass):
 
         self.resolve_virtual_columns(*tuple(self.missing_columns))
 
-        self.config = self.normalize_config(self._meta.__dict__, self.query_config)
+        # The declared options are shared by every instance of the class, so normalize a copy.
+        self.config = self.normalize_config(dict(self._meta.__dict__), self.query_config)
 
         self.config["column_searches"] = {}
         for i, name in enumerate(self.columns.keys()):
@@ -371,7 +383,14 @@ class Datatable(metaclass=DatatableMetaclass):
         if default_ordering is None and config["model"]:
             default_ordering = config["model"]._meta.ordering
 
-        sort_declarations = [k for k in query_config if re.match(r"^order\[\d+\]\[column\]$", k)]
+        # Only the declared priorities need visiting, in order, instead of every possible one
+        sort_declarations = sorted(
+            {
+                int(match.group(1))
+                for match in map(_SORT_DECLARATION_RE.match, query_config)
+                if match
+            }
+        )
 
         # Default sorting from view or model definition
         if len(sort_declarations) == 0:
@@ -380,7 +399,9 @@ class Datatable(metaclass=DatatableMetaclass):
         ordering = []
         columns_list = list(self.columns.values())
 
-        for sort_queue_i in range(len(columns_list)):
+        for sort_queue_i in sort_declarations:
+            if sort_queue_i >= len(columns_list):
+                break
             try:
                 column_index = int(
                     query_config.get(OPTION_NAME_MAP["sort_column"] % sort_queue_i, "")
@@ -612,6 +633,10 @@ class Datatable(metaclass=DatatableMetaclass):
         # Narrow the results to the appropriate page length for serialization
         if self.config["page_length"] != -1:
             i_begin = self.config["start_offset"]
+            if self.unpaged_record_count is not None and i_begin >= self.unpaged_record_count:
+                # Nothing left at this offset (e.g., a stale page after a search narrowed the
+                # results), so skip querying for it.
+                return []
             i_end = self.config["start_offset"] + self.config["page_length"]
             object_list = self._records[i_begin:i_end]
         else:
@@ -654,6 +679,7 @@ class Datatable(metaclass=DatatableMetaclass):
         self._records = None
         base_objects = self.get_object_list()
         filtered_objects = self.search(base_objects)
+        filtered_objects = self.select_related(filtered_objects)
         filtered_objects = self.sort(filtered_objects)
         self._records = filtered_objects
 
@@ -698,6 +724,26 @@ class Datatable(metaclass=DatatableMetaclass):
 
         return num_total, num_filtered
 
+    def select_related(self, queryset):
+        """
+        When ``Meta.auto_select_related`` is enabled, joins the single-valued relationships that the
+        columns' sources walk through, so that reading them for each row doesn't cost a query.
+        """
+        if not self.config["auto_select_related"] or not isinstance(queryset, QuerySet):
+            return queryset
+
+        # Callable sources are computed per row and have no ORM path to walk
+        sources = [
+            source
+            for column in self.columns.values()
+            for source in column.sources
+            if isinstance(source, str)
+        ]
+        select_related, _ = get_related_lookups(queryset.model, sources)
+        if select_related:
+            queryset = queryset.select_related(*select_related)
+        return queryset
+
     def search(self, queryset):
         """Performs db-only queryset searches."""
 
@@ -763,6 +809,11 @@ class Datatable(metaclass=DatatableMetaclass):
             if sources:
                 fields.extend([(sort_direction + source) for source in sources])
 
+        # The pk breaks ties, or stands in when no database sort is requested, so that paging walks
+        # a stable order even over the joins added by select_related().
+        pk_names = ("pk", queryset.model._meta.pk.name)
+        if not any(isinstance(f, str) and f.lstrip("-") in pk_names for f in fields):
+            fields.append("pk")
         object_list = queryset.order_by(*fields)
 
         # When sorting a plural relationship field, we get duplicate rows for each item on the other
@@ -960,8 +1011,7 @@ class Datatable(metaclass=DatatableMetaclass):
         if not hasattr(self, "config"):
             self.configure()
 
-        for column in self.columns.values():
-            yield column
+        yield from self.columns.values()
 
 
 class ValuesDatatable(Datatable):
@@ -991,6 +1041,10 @@ class ValuesDatatable(Datatable):
         self.object_list = self.get_valuesqueryset(self.object_list)
         super(ValuesDatatable, self).populate_records()
 
+    def select_related(self, queryset):
+        """Values are already selected by their full ORM paths, so no joins are added."""
+        return queryset
+
     def get_object_pk(self, obj):
         """
         Correctly reads the pk from the ValuesQuerySet entry, as a dict item instead of an
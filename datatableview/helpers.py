@@ -9,7 +9,9 @@ in any way.
 """
 
 from functools import partial, wraps
+import builtins
 import operator
+import re
 
 from django.db.models import Model
 from django.forms.utils import flatatt
@@ -18,6 +20,9 @@ from .utils import resolve_orm_path, XEDITABLE_FIELD_TYPES
 
 from django.utils.timezone import localtime
 
+# A format string that is nothing but one positional field, like "{:,}" or "{0:.2f}"
+_SINGLE_FIELD_FORMAT_RE = re.compile(r"\{0?(?::([^{}]*))?\}")
+
 
 def keyed_helper(helper):
     """
@@ -164,22 +169,25 @@ def itemgetter(k, ellipsis=False, key=None):
 
     """
 
-    def helper(instance, *args, **kwargs):
-        default_value = kwargs.get("default_value")
-        if default_value is None:
-            default_value = instance
-        value = default_value[k]
-        if (
-            ellipsis
-            and isinstance(k, slice)
-            and isinstance(value, str)
-            and len(default_value) > len(value)
-        ):
-            if ellipsis is True:
-                value += "..."
-            else:
-                value += ellipsis
-        return value
+    if not ellipsis:
+        # Nothing can be appended to the result, so the lookup is all there is to do
+        def helper(instance, *args, **kwargs):
+            default_value = kwargs.get("default_value")
+            if default_value is None:
+                default_value = instance
+            return default_value[k]
+
+    else:
+        suffix = "..." if ellipsis is True else ellipsis
+
+        def helper(instance, *args, **kwargs):
+            default_value = kwargs.get("default_value")
+            if default_value is None:
+                default_value = instance
+            value = default_value[k]
+            if isinstance(k, slice) and isinstance(value, str) and len(default_value) > len(value):
+                value += suffix
+            return value
 
     if key:
         helper = keyed_helper(helper)(key=key)
@@ -205,9 +213,11 @@ def attrgetter(attr, key=None):
 
     """
 
+    bits = attr.split(".")
+
     def helper(instance, *args, **kwargs):
         value = instance
-        for bit in attr.split("."):
+        for bit in bits:
             value = getattr(value, bit)
             if callable(value):
                 value = value()
@@ -277,6 +287,19 @@ def format(format_string, cast=lambda x: x):
 
     """
 
+    match = _SINGLE_FIELD_FORMAT_RE.fullmatch(format_string)
+    if match:
+        # Skip parsing the format string for every row and apply its spec directly
+        format_spec = match.group(1) or ""
+
+        def helper(instance, *args, **kwargs):
+            value = kwargs.get("default_value")
+            if value is None:
+                value = instance
+            return builtins.format(cast(value), format_spec)
+
+        return helper
+
     def helper(instance, *args, **kwargs):
         value = kwargs.get("default_value")
         if value is None:
@@ -1,13 +1,24 @@
 from django.apps import apps
 from django.core.management import call_command
+from django.db import models
 
-from datatableview.columns import Column, COLUMN_CLASSES
+from datatableview.columns import (
+    Column,
+    TextColumn,
+    COLUMN_CLASSES,
+    clear_column_class_cache,
+    get_column_for_modelfield,
+)
 from .testcase import DatatableViewTestCase
 
 ExampleModel = apps.get_model("test_app", "ExampleModel")
 
 
 class ColumnTests(DatatableViewTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.obj = ExampleModel.objects.create(name="test name 1")
+
     def test_custom_column_registers_itself(self):
         previous_length = len(COLUMN_CLASSES)
 
@@ -22,12 +33,25 @@ class ColumnTests(DatatableViewTestCase):
         )
 
         del COLUMN_CLASSES[:1]
+        clear_column_class_cache()
 
-    def test_value_is_pair(self):
-        obj = ExampleModel.objects.create(name="test name 1")
+    def test_custom_column_replaces_resolved_column_class(self):
+        field = ExampleModel._meta.get_field("name")
+        self.assertIs(get_column_for_modelfield(field), TextColumn)
+
+        class CustomColumn(Column):
+            model_field_class = models.CharField
 
+        try:
+            self.assertIs(get_column_for_modelfield(field), CustomColumn)
+        finally:
+            del COLUMN_CLASSES[:1]
+            clear_column_class_cache()
+        self.assertIs(get_column_for_modelfield(field), TextColumn)
+
+    def test_value_is_pair(self):
         column = Column()
-        value = column.value(obj)
+        value = column.value(self.obj)
         self.assertEqual(type(value), tuple)
 
     # def test_process_value_checks_all_sources(self):
@@ -37,14 +61,18 @@ class ColumnTests(DatatableViewTestCase):
         def processor(value, **kwargs):
             processed.append(value)
 
-        obj = ExampleModel.objects.create(name="test name 1")
-
         # Verify bad source names don't find values
         processed[:] = []
         column = Column(sources=["fake1"], processor=processor)
-        column.value(obj)
+        column.value(self.obj)
         self.assertEqual(processed, [])
 
         column = Column(sources=["fake1", "fake2"], processor=processor)
-        column.value(obj)
+        column.value(self.obj)
         self.assertEqual(processed, [])
+
+    def test_get_db_sources_splits_db_and_virtual_sources(self):
+        column = Column(sources=["name", "related__name", "get_absolute_url"])
+        for _ in range(2):  # The second pass is answered from the resolved-path cache
+            self.assertEqual(column.get_db_sources(ExampleModel), ["name", "related__name"])
+            self.assertEqual(column.get_virtual_sources(ExampleModel), ["get_absolute_url"])
@@ -1,22 +1,41 @@
 import datetime
-from inspect import isgenerator
+from types import GeneratorType
 
 from django.apps import apps
+from django.test import SimpleTestCase
 
 from .testcase import DatatableViewTestCase
 from datatableview.exceptions import ColumnError
 from datatableview.datatables import Datatable, ValuesDatatable
 from datatableview.views import DatatableJSONResponseMixin, DatatableView
-from datatableview.columns import TextColumn, Column, BooleanColumn
+from datatableview.columns import TextColumn, Column, BooleanColumn, CheckBoxSelectColumn
 
 ExampleModel = apps.get_model("test_app", "ExampleModel")
 RelatedModel = apps.get_model("test_app", "RelatedModel")
 
+# Datatables only read their query_config, so the common single-column sorts are shared
+_ORDER_ASC_0 = {"order[0][column]": "0", "order[0][dir]": "asc"}
+_ORDER_DESC_0 = {"order[0][column]": "0", "order[0][dir]": "desc"}
+
+
+class NameDatatable(Datatable):
+    """Shared by the tests that only need the ``name`` column."""
+
+    class Meta:
+        model = ExampleModel
+        columns = ["name"]
+
+
+class DatatableConfigTests(SimpleTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super(DatatableConfigTests, cls).setUpClass()
+        # Tests that only read a default configuration share one instance
+        cls.empty_datatable = Datatable([], "/")
+        cls.empty_datatable.configure()
 
-class DatatableTests(DatatableViewTestCase):
     def test_normalize_config(self):
-        dt = Datatable([], "/")
-        dt.configure()
+        dt = self.empty_datatable
         self.assertEqual(dt.config["hidden_columns"], [])
         self.assertEqual(dt.config["search_fields"], [])
         self.assertEqual(dt.config["unsortable_columns"], [])
@@ -42,12 +61,17 @@ class DatatableTests(DatatableViewTestCase):
                 model = ExampleModel
                 columns = ["name"]
 
-        class NoError(BaseException):
-            pass
+        dt = DT([], "/")
+        dt.configure()  # Raises ColumnError for names it can't find
+        self.assertEqual(list(dt.columns), ["name"])
 
-        with self.assertRaises(NoError):
-            DT([], "/")
-            raise NoError()
+    def test_column_names_list_is_frozen(self):
+        class DT(Datatable):
+            class Meta:
+                model = ExampleModel
+                columns = ["name", "value"]
+
+        self.assertEqual(DT._meta.columns, ("name", "value"))
 
     def test_column_names_list_raises_related_columns(self):
         # This was the old way of including related data, but this is no longer supported
@@ -69,18 +93,13 @@ class DatatableTests(DatatableViewTestCase):
                 model = ExampleModel
                 columns = ["name", "related"]
 
-        class NoError(BaseException):
-            pass
-
-        with self.assertRaises(NoError):
-            DT([], "/")
-            raise NoError()
+        dt = DT([], "/")
+        dt.configure()  # Raises ColumnError for names it can't find
+        self.assertEqual(list(dt.columns), ["name", "related"])
 
     def test_get_ordering_splits(self):
         # Verify empty has blank db-backed list and virtual list
-        dt = Datatable([], "/")
-        dt.configure()
-        self.assertEqual(dt.get_ordering_splits(), ([], []))
+        self.assertEqual(self.empty_datatable.get_ordering_splits(), ([], []))
 
         class DT(Datatable):
             fake = TextColumn("Fake", sources=["get_absolute_url"])
@@ -89,65 +108,223 @@ class DatatableTests(DatatableViewTestCase):
                 model = ExampleModel
                 columns = ["name", "fake"]
 
-        # Verify a fake field name ends up separated from the db-backed field
-        dt = DT(
-            [], "/", query_config={"order[0][column]": "0", "order[0][dir]": "asc"}
-        )  # iSortingCols': '1',
-        dt.configure()
-        self.assertEqual(dt.get_ordering_splits(), (["name"], []))
+        cases = [
+            # A fake field name ends up separated from the db-backed field
+            (["0"], (["name"], [])),
+            # ['name', 'fake'] sends 'name' to db sort list, but keeps 'fake' in manual sort list
+            (["0", "1"], (["name"], ["fake"])),
+            # A fake field name as the sort column correctly finds no db sort fields
+            (["1"], ([], ["fake"])),
+            # ['fake', 'name'] sends both fields to manual sort list
+            (["1", "0"], ([], ["fake", "name"])),
+        ]
+        for sort_columns, expected in cases:
+            query_config = {}
+            for i, column_index in enumerate(sort_columns):
+                query_config["order[%d][column]" % i] = column_index
+                query_config["order[%d][dir]" % i] = "asc"
+            with self.subTest(sort_columns=sort_columns):
+                dt = DT([], "/", query_config=query_config)
+                dt.configure()
+                self.assertEqual(dt.get_ordering_splits(), expected)
+
+    def test_normalize_config_ordering_skips_gaps_and_overflow(self):
+        class DT(Datatable):
+            class Meta:
+                model = ExampleModel
+                columns = ["name", "value"]
 
-        # Verify ['name', 'fake'] ordering sends 'name' to db sort list, but keeps 'fake' in manual
-        # sort list.
+        # No priority 0, and priority 5 is beyond the number of columns
         dt = DT(
             [],
             "/",
             query_config={
-                "order[0][column]": "0",
-                "order[0][dir]": "asc",
-                "order[1][column]": "1",
-                "order[1][dir]": "asc",
+                "order[1][column]": "0",
+                "order[1][dir]": "desc",
+                "order[5][column]": "1",
+                "order[5][dir]": "asc",
             },
-        )  # 'iSortingCols': '2',
+        )
         dt.configure()
-        self.assertEqual(dt.get_ordering_splits(), (["name"], ["fake"]))
+        self.assertEqual(dt.config["ordering"], ["-name"])
 
-        # Verify a fake field name as the sort column correctly finds no db sort fields
-        dt = DT(
-            [], "/", query_config={"order[0][column]": "1", "order[0][dir]": "asc"}
-        )  # 'iSortingCols': '1',
-        dt.configure()
-        self.assertEqual(dt.get_ordering_splits(), ([], ["fake"]))
+        class ThreeColumnDT(DT):
+            class Meta(DT.Meta):
+                columns = ["name", "value", "related"]
 
-        # Verify ['fake', 'name'] ordering sends both fields to manual sort list
-        dt = DT(
+        # A gap between declared priorities doesn't cut off the ones after it
+        dt = ThreeColumnDT(
             [],
             "/",
             query_config={
                 "order[0][column]": "1",
                 "order[0][dir]": "asc",
-                "order[1][column]": "0",
-                "order[1][dir]": "asc",
+                "order[2][column]": "0",
+                "order[2][dir]": "desc",
             },
-        )  # 'iSortingCols': '2',
+        )
         dt.configure()
-        self.assertEqual(dt.get_ordering_splits(), ([], ["fake", "name"]))
+        self.assertEqual(dt.config["ordering"], ["value", "-name"])
 
-    def test_get_records_populates_cache(self):
-        ExampleModel.objects.create(name="test name")
-        queryset = ExampleModel.objects.all()
+    def test_get_processor_method(self):
+        class Dummy(object):
+            def fake_callback(self):
+                pass
 
-        dt = Datatable(queryset, "/")
-        dt.get_records()
-        self.assertIsNotNone(dt._records)
-        records = dt._records
+        view = Dummy()
 
-        # _records doesn't change when run again
-        dt.get_records()
-        self.assertEqual(dt._records, records)
+        # Test no callback given
+        f = self.empty_datatable.get_processor_method(Column("Fake", sources=["fake"]), i=0)
+        self.assertEqual(f, None)
+
+        class DT(Datatable):
+            def fake_callback(self):
+                pass
+
+        column = Column("Fake", sources=["fake"], processor="fake_callback")
+
+        # Test callback found on self
+        dt = DT([], "/")
+        f = dt.get_processor_method(column, i=0)
+        self.assertEqual(f, dt.fake_callback)
+
+        # Test callback found on callback_target
+        dt = Datatable([], "/", callback_target=view)
+        f = dt.get_processor_method(column, i=0)
+        self.assertEqual(f, view.fake_callback)
+
+    def test_get_processor_method_returns_direct_callable(self):
+        def fake_callback():
+            pass
+
+        column = Column("Fake", sources=[], processor=fake_callback)
+
+        # Test no callback given
+        f = self.empty_datatable.get_processor_method(column, i=0)
+        self.assertEqual(f, fake_callback)
+
+    def test_get_processor_method_finds_implied_callback(self):
+        class DummyNamed(object):
+            def get_column_fake_data(self):
+                pass
+
+        class DummyIndexed(object):
+            def get_column_0_data(self):
+                pass
+
+        class DummyBoth(object):
+            def get_column_fake_data(self):
+                pass
+
+            def get_column_0_data(self):
+                pass
+
+        column = Column("Fake", sources=[])
+        column.name = "fake"
+
+        # Test implied named callback found first
+        view = DummyNamed()
+        dt = Datatable([], "/", callback_target=view)
+        f = dt.get_processor_method(column, i=0)
+        self.assertEqual(f, view.get_column_fake_data)
+
+        # Test implied named callback found first
+        view = DummyIndexed()
+        dt = Datatable([], "/", callback_target=view)
+        f = dt.get_processor_method(column, i=0)
+        self.assertEqual(f, view.get_column_0_data)
+
+        # Test implied named callback found first
+        view = DummyBoth()
+        dt = Datatable([], "/", callback_target=view)
+        f = dt.get_processor_method(column, i=0)
+        self.assertEqual(f, view.get_column_fake_data)
+
+        class DTNamed(Datatable):
+            def get_column_fake_data(self):
+                pass
+
+        class DTIndexed(Datatable):
+            def get_column_0_data(self):
+                pass
+
+        class DTBoth(Datatable):
+            def get_column_fake_data(self):
+                pass
+
+            def get_column_0_data(self):
+                pass
+
+        # Test implied named callback found first
+        dt = DTNamed([], "/")
+        f = dt.get_processor_method(column, i=0)
+        self.assertEqual(f, dt.get_column_fake_data)
+
+        # Test implied named callback found first
+        dt = DTIndexed([], "/")
+        f = dt.get_processor_method(column, i=0)
+        self.assertEqual(f, dt.get_column_0_data)
+
+        # Test implied named callback found first
+        dt = DTBoth([], "/")
+        f = dt.get_processor_method(column, i=0)
+        self.assertEqual(f, dt.get_column_fake_data)
+
+    def test_iter_datatable_yields_columns(self):
+        class CustomColumn1(Column):
+            pass
+
+        class CustomColumn2(Column):
+            pass
+
+        class DT(Datatable):
+            fake1 = CustomColumn1("Fake1", sources=["get_absolute_url"])
+            fake2 = CustomColumn2("Fake2", sources=["get_absolute_url"])
+
+            class Meta:
+                model = ExampleModel
+                columns = ["name", "fake1", "fake2"]
+
+        dt = DT([], "/")
+        columns = iter(dt)
+        self.assertIsInstance(columns, GeneratorType)
+        self.assertEqual(
+            list(columns), [dt.columns["name"], dt.columns["fake1"], dt.columns["fake2"]]
+        )
+
+    def test_structure_template_column_labels(self):
+        class DT(Datatable):
+            name = TextColumn("<b>Name</b>", "name")
+            select = CheckBoxSelectColumn()
+
+            class Meta:
+                model = ExampleModel
+                columns = ["name", "select"]
+
+        # The default template renders labels as given, so columns can put markup in the header
+        html = str(DT([], "/"))
+        self.assertIn("><b>Name</b></th>", html)
+        self.assertIn("data-id='all'", html)
+
+        class BootstrapDT(DT):
+            class Meta(DT.Meta):
+                structure_template = ["datatableview/bootstrap_structure.html"]
+
+        # The Bootstrap template escapes them
+        html = str(BootstrapDT([], "/"))
+        self.assertIn(">&lt;b&gt;Name&lt;/b&gt;</th>", html)
+        self.assertNotIn("<b>", html)
+
+
+class DatatableTests(DatatableViewTestCase):
+    @classmethod
+    def _make_names(cls, *names):
+        # Created one at a time, since bulk_create() doesn't set pks on every backend (MySQL)
+        return [ExampleModel.objects.create(name=name) for name in names]
 
     def test_populate_records_searches(self):
         obj1 = ExampleModel.objects.create(name="test name 1", value=False)
-        ExampleModel.objects.create(name="test name 2", value=True)
+        obj2 = ExampleModel.objects.create(name="test name 2", value=True)
         queryset = ExampleModel.objects.all()
 
         class DT(Datatable):
@@ -160,7 +337,7 @@ class DatatableTests(DatatableViewTestCase):
         # Sanity check for correct initial queryset
         dt.populate_records()
         self.assertIsNotNone(dt._records)
-        self.assertEqual(list(dt._records), list(queryset))
+        self.assertEqual(list(dt._records), [obj1, obj2])
 
         # Verify a search eliminates items from _records
         dt = DT(queryset, "/", query_config={"search[value]": "test name 1"})
@@ -169,58 +346,65 @@ class DatatableTests(DatatableViewTestCase):
         self.assertEqual(list(dt._records), [obj1])
 
     def test_populate_records_sorts(self):
-        obj1 = ExampleModel.objects.create(name="test name 1")
-        obj2 = ExampleModel.objects.create(name="test name 2")
+        obj1, obj2 = self._make_names("test name 1", "test name 2")
         queryset = ExampleModel.objects.all()
 
-        class DT(Datatable):
-            class Meta:
-                model = ExampleModel
-                columns = ["name"]
-
-        dt = DT(queryset, "/")
+        dt = NameDatatable(queryset, "/")
 
         # Sanity check for correct initial queryset
         dt.populate_records()
         self.assertIsNotNone(dt._records)
-        self.assertEqual(list(dt._records), list(queryset))
+        self.assertEqual(list(dt._records), [obj1, obj2])
 
         # Verify a sort changes the ordering of the records list
-        dt = DT(
-            queryset, "/", query_config={"order[0][column]": "0", "order[0][dir]": "desc"}
-        )  # # 'iSortingCols': '1',
+        dt = NameDatatable(queryset, "/", query_config=_ORDER_DESC_0)
         dt.populate_records()
         self.assertIsNotNone(dt._records)
         self.assertEqual(list(dt._records), [obj2, obj1])
 
-    def test_populate_records_avoids_column_callbacks(self):
-        ExampleModel.objects.create(name="test name 1")
+    def test_populate_records_auto_select_related(self):
+        related = RelatedModel.objects.create(name="test related")
+        ExampleModel.objects.create(name="test name", related=related)
         queryset = ExampleModel.objects.all()
 
         class DT(Datatable):
-            def preload_record_data(self, obj):
-                raise Exception("Don't run this")
+            related = TextColumn("Related", ["related__name"])
 
+            class Meta:
+                model = ExampleModel
+                columns = ["name", "related"]
+
+        # The option is off by default
         dt = DT(queryset, "/")
-        try:
-            dt.populate_records()
-        except Exception as e:
-            if str(e) == "Don't run this":
-                raise AssertionError("Per-row callbacks being executed!")
-            raise
+        dt.populate_records()
+        self.assertEqual(dt._records.query.select_related, False)
 
-    def test_preload_record_data_calls_view(self):
-        ExampleModel.objects.create(name="test name 1")
-        queryset = ExampleModel.objects.all()
+        class AutoDT(DT):
+            upper_name = TextColumn("Upper name", [lambda obj, **kwargs: obj.name.upper()])
 
-        class Dummy(object):
-            def preload_record_data(self, obj):
-                raise Exception("We did it")
+            class Meta(DT.Meta):
+                columns = ["name", "related", "upper_name"]
+                auto_select_related = True
 
-        dt = Datatable(queryset, "/", callback_target=Dummy())
-        with self.assertRaises(Exception) as cm:
-            dt.get_records()
-        self.assertEqual(str(cm.exception), "We did it")
+        dt = AutoDT(queryset, "/")
+        dt.populate_records()
+        with self.assertNumQueries(1):
+            self.assertEqual([obj.related.name for obj in dt._records], ["test related"])
+
+    def test_sort_breaks_ties_by_pk(self):
+        obj1 = ExampleModel.objects.create(name="a")
+        obj2 = ExampleModel.objects.create(name="a")
+        obj3 = ExampleModel.objects.create(name="b")
+
+        # With no sort requested, pk order replaces whatever ordering the queryset had
+        dt = NameDatatable(ExampleModel.objects.order_by("-pk"), "/")
+        dt.populate_records()
+        self.assertEqual(dt.get_ordering_splits(), ([], []))
+        self.assertEqual(list(dt._records), [obj1, obj2, obj3])
+
+        dt = NameDatatable(ExampleModel.objects.all(), "/", query_config=_ORDER_DESC_0)
+        dt.populate_records()
+        self.assertEqual(list(dt._records), [obj3, obj1, obj2])
 
     def test_sort_defaults_to_meta_ordering(self):
         # Defined so that 'pk' order != 'name' order
@@ -247,9 +431,10 @@ class DatatableTests(DatatableViewTestCase):
             model = ExampleModel
 
         dtv = DTV().get_datatable(url="/")
-        self.assertIn(
+        dtv.configure()
+        self.assertEqual(
+            str(dtv.columns["name"]),
             '<th data-name="name" data-config-sortable="true" data-config-sorting="0,0,asc" data-config-visible="true">Name</th>',
-            dtv.__str__(),
         )
 
         class DT(Datatable):
@@ -279,16 +464,12 @@ class DatatableTests(DatatableViewTestCase):
                 columns = ["name"]
                 ordering = ["pk"]
 
-        dt = DT(
-            queryset, "/", query_config={"order[0][column]": "0", "order[0][dir]": "asc"}
-        )  # 'iSortingCols': '1',
+        dt = DT(queryset, "/", query_config=_ORDER_ASC_0)
         dt.populate_records()
         self.assertEqual(dt.get_ordering_splits(), (["name"], []))
         self.assertEqual(list(dt._records), [obj2, obj1])
 
-        dt = DT(
-            queryset, "/", query_config={"order[0][column]": "0", "order[0][dir]": "desc"}
-        )  # 'iSortingCols': '1',
+        dt = DT(queryset, "/", query_config=_ORDER_DESC_0)
         dt.populate_records()
         self.assertEqual(dt.get_ordering_splits(), (["-name"], []))
         self.assertEqual(list(dt._records), [obj1, obj2])
@@ -296,9 +477,7 @@ class DatatableTests(DatatableViewTestCase):
     def test_sort_uses_all_sources(self):
         from datetime import timedelta
 
-        obj1 = ExampleModel.objects.create(name="a")
-        obj2 = ExampleModel.objects.create(name="a")
-        obj3 = ExampleModel.objects.create(name="b")
+        obj1, obj2, obj3 = self._make_names("a", "a", "b")
         obj1.date_created = (obj1.date_created + timedelta(days=3)).replace(
             tzinfo=datetime.timezone.utc
         )
@@ -308,9 +487,7 @@ class DatatableTests(DatatableViewTestCase):
         obj3.date_created = (obj3.date_created + timedelta(days=2)).replace(
             tzinfo=datetime.timezone.utc
         )
-        obj1.save()
-        obj2.save()
-        obj3.save()
+        ExampleModel.objects.bulk_update([obj1, obj2, obj3], ["date_created"])
 
         queryset = ExampleModel.objects.all()
 
@@ -321,16 +498,12 @@ class DatatableTests(DatatableViewTestCase):
                 model = ExampleModel
                 columns = ["my_column"]
 
-        dt = DT(
-            queryset, "/", query_config={"order[0][column]": "0", "order[0][dir]": "asc"}
-        )  # 'iSortingCols': '1',
+        dt = DT(queryset, "/", query_config=_ORDER_ASC_0)
         dt.populate_records()
         self.assertEqual(dt.get_ordering_splits(), (["my_column"], []))
         self.assertEqual(list(dt._records), [obj2, obj1, obj3])
 
-        dt = DT(
-            queryset, "/", query_config={"order[0][column]": "0", "order[0][dir]": "desc"}
-        )  # 'iSortingCols': '1',
+        dt = DT(queryset, "/", query_config=_ORDER_DESC_0)
         dt.populate_records()
         self.assertEqual(dt.get_ordering_splits(), (["-my_column"], []))
         self.assertEqual(list(dt._records), [obj3, obj1, obj2])
@@ -344,16 +517,12 @@ class DatatableTests(DatatableViewTestCase):
                 model = ExampleModel
                 columns = ["my_column"]
 
-        dt = DT(
-            queryset, "/", query_config={"order[0][column]": "0", "order[0][dir]": "asc"}
-        )  # 'iSortingCols': '1',
+        dt = DT(queryset, "/", query_config=_ORDER_ASC_0)
         dt.populate_records()
         self.assertEqual(dt.get_ordering_splits(), (["my_column"], []))
         self.assertEqual(list(dt._records), [obj2, obj3, obj1])
 
-        dt = DT(
-            queryset, "/", query_config={"order[0][column]": "0", "order[0][dir]": "desc"}
-        )  # 'iSortingCols': '1',
+        dt = DT(queryset, "/", query_config=_ORDER_DESC_0)
         dt.populate_records()
         self.assertEqual(dt.get_ordering_splits(), (["-my_column"], []))
         self.assertEqual(list(dt._records), [obj1, obj3, obj2])
@@ -361,9 +530,7 @@ class DatatableTests(DatatableViewTestCase):
     def test_sort_ignores_virtual_sources_when_mixed(self):
         from datetime import timedelta
 
-        obj1 = ExampleModel.objects.create(name="a")
-        obj2 = ExampleModel.objects.create(name="b")
-        obj3 = ExampleModel.objects.create(name="a")
+        obj1, obj2, obj3 = self._make_names("a", "b", "a")
 
         queryset = ExampleModel.objects.all()
 
@@ -374,16 +541,12 @@ class DatatableTests(DatatableViewTestCase):
                 model = ExampleModel
                 columns = ["my_column"]
 
-        dt = DT(
-            queryset, "/", query_config={"order[0][column]": "0", "order[0][dir]": "asc"}
-        )  # 'iSortingCols': '1',
+        dt = DT(queryset, "/", query_config=_ORDER_ASC_0)
         dt.populate_records()
         self.assertEqual(dt.get_ordering_splits(), (["my_column"], []))
         self.assertEqual(list(dt._records), [obj1, obj3, obj2])
 
-        dt = DT(
-            queryset, "/", query_config={"order[0][column]": "0", "order[0][dir]": "desc"}
-        )  # 'iSortingCols': '1',
+        dt = DT(queryset, "/", query_config=_ORDER_DESC_0)
         dt.populate_records()
         self.assertEqual(dt.get_ordering_splits(), (["-my_column"], []))
         self.assertEqual(list(dt._records), [obj2, obj1, obj3])  # pk is natural ordering 1,3 here
@@ -402,24 +565,18 @@ class DatatableTests(DatatableViewTestCase):
                 # Return data that would make the sort order wrong if it were consulted for sorting
                 return obj.pk  # tracks with get_absolute_url
 
-        dt = DT(
-            queryset, "/", query_config={"order[0][column]": "0", "order[0][dir]": "asc"}
-        )  # 'iSortingCols': '1',
+        dt = DT(queryset, "/", query_config=_ORDER_ASC_0)
         dt.populate_records()
         self.assertEqual(list(dt._records), [obj1, obj3, obj2])
 
-        dt = DT(
-            queryset, "/", query_config={"order[0][column]": "0", "order[0][dir]": "desc"}
-        )  # 'iSortingCols': '1',
+        dt = DT(queryset, "/", query_config=_ORDER_DESC_0)
         dt.populate_records()
         self.assertEqual(list(dt._records), [obj2, obj1, obj3])  # pk is natural ordering 1,3 here
 
     def test_sort_uses_virtual_sources_when_no_db_sources_available(self):
         from datetime import timedelta
 
-        obj1 = ExampleModel.objects.create(name="a")
-        obj2 = ExampleModel.objects.create(name="b")
-        obj3 = ExampleModel.objects.create(name="c")
+        obj1, obj2, obj3 = self._make_names("a", "b", "c")
 
         queryset = ExampleModel.objects.all()
 
@@ -430,42 +587,89 @@ class DatatableTests(DatatableViewTestCase):
                 model = ExampleModel
                 columns = ["pk"]
 
-        dt = DT(
-            queryset, "/", query_config={"order[0][column]": "0", "order[0][dir]": "asc"}
-        )  # 'iSortingCols': '1',
+        dt = DT(queryset, "/", query_config=_ORDER_ASC_0)
         dt.populate_records()
         self.assertEqual(dt.get_ordering_splits(), ([], ["pk"]))
         self.assertEqual(list(dt._records), [obj3, obj2, obj1])
 
-        dt = DT(
-            queryset, "/", query_config={"order[0][column]": "0", "order[0][dir]": "desc"}
-        )  # 'iSortingCols': '1',
+        dt = DT(queryset, "/", query_config=_ORDER_DESC_0)
         dt.populate_records()
         self.assertEqual(dt.get_ordering_splits(), ([], ["-pk"]))
         self.assertEqual(list(dt._records), [obj1, obj2, obj3])
 
+
+class RecordTests(DatatableViewTestCase):
+    fixtures = ["test_data.json"]
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.obj1 = ExampleModel.objects.get(pk=1)
+
+    def test_get_records_populates_cache(self):
+        queryset = ExampleModel.objects.all()
+
+        dt = Datatable(queryset, "/")
+        dt.get_records()
+        self.assertIsNotNone(dt._records)
+        records = dt._records
+
+        # _records doesn't change when run again
+        dt.get_records()
+        self.assertEqual(dt._records, records)
+
+    def test_get_records_past_last_page_skips_query(self):
+        queryset = ExampleModel.objects.all()
+
+        dt = Datatable(queryset, "/", query_config={"start": "25"})
+        dt.populate_records()
+        with self.assertNumQueries(0):
+            self.assertEqual(dt.get_records(), [])
+
+    def test_populate_records_avoids_column_callbacks(self):
+        queryset = ExampleModel.objects.all()
+
+        class DT(Datatable):
+            def preload_record_data(self, obj):
+                raise Exception("Don't run this")
+
+        dt = DT(queryset, "/")
+        try:
+            dt.populate_records()
+        except Exception as e:
+            if str(e) == "Don't run this":
+                raise AssertionError("Per-row callbacks being executed!")
+            raise
+
+    def test_preload_record_data_calls_view(self):
+        queryset = ExampleModel.objects.all()
+
+        class Dummy(object):
+            def preload_record_data(self, obj):
+                raise Exception("We did it")
+
+        dt = Datatable(queryset, "/", callback_target=Dummy())
+        with self.assertRaises(Exception) as cm:
+            dt.get_records()
+        self.assertEqual(str(cm.exception), "We did it")
+
     def test_get_object_pk(self):
-        obj1 = ExampleModel.objects.create(name="test name 1")
         queryset = ExampleModel.objects.all()
         dt = Datatable(queryset, "/")
-        self.assertEqual(dt.get_object_pk(obj1), obj1.pk)
+        self.assertEqual(dt.get_object_pk(self.obj1), self.obj1.pk)
 
     def test_get_extra_record_data_passes_through_to_object_serialization(self):
-        obj1 = ExampleModel.objects.create(name="test name 1")
-        ExampleModel.objects.all()
 
         class DT(Datatable):
             def get_extra_record_data(self, obj):
                 return {"custom": "data"}
 
         dt = DT([], "/")
-        data = dt.get_record_data(obj1)
+        data = dt.get_record_data(self.obj1)
         self.assertIn("_extra_data", data)
         self.assertIn("custom", data["_extra_data"])
         self.assertEqual(data["_extra_data"]["custom"], "data")
 
     def test_get_extra_record_data_passes_through_to_json_response(self):
-        ExampleModel.objects.create(name="test name 1")
         queryset = ExampleModel.objects.all()
 
         class DT(Datatable):
@@ -501,179 +705,45 @@ class DatatableTests(DatatableViewTestCase):
                 model = ExampleModel
                 columns = ["name", "fake1", "fake2"]
 
-        obj1 = ExampleModel.objects.create(name="test name 1")
         queryset = ExampleModel.objects.all()
         dt = DT(queryset, "/")
-        data = dt.get_record_data(obj1)
+        data = dt.get_record_data(self.obj1)
         self.assertIn("1", data)
         self.assertIn(data["1"], "first")
         self.assertIn("2", data)
         self.assertIn(data["2"], "second")
 
-    def test_get_processor_method(self):
-        class Dummy(object):
-            def fake_callback(self):
-                pass
-
-        view = Dummy()
-
-        # Test no callback given
-        dt = Datatable([], "/")
-        f = dt.get_processor_method(Column("Fake", sources=["fake"]), i=0)
-        self.assertEqual(f, None)
-
-        class DT(Datatable):
-            def fake_callback(self):
-                pass
-
-        column = Column("Fake", sources=["fake"], processor="fake_callback")
-
-        # Test callback found on self
-        dt = DT([], "/")
-        f = dt.get_processor_method(column, i=0)
-        self.assertEqual(f, dt.fake_callback)
-
-        # Test callback found on callback_target
-        dt = Datatable([], "/", callback_target=view)
-        f = dt.get_processor_method(column, i=0)
-        self.assertEqual(f, view.fake_callback)
-
-    def test_get_processor_method_returns_direct_callable(self):
-        def fake_callback():
-            pass
-
-        column = Column("Fake", sources=[], processor=fake_callback)
-
-        # Test no callback given
-        dt = Datatable([], "/")
-        f = dt.get_processor_method(column, i=0)
-        self.assertEqual(f, fake_callback)
-
-    def test_get_processor_method_finds_implied_callback(self):
-        class DummyNamed(object):
-            def get_column_fake_data(self):
-                pass
-
-        class DummyIndexed(object):
-            def get_column_0_data(self):
-                pass
-
-        class DummyBoth(object):
-            def get_column_fake_data(self):
-                pass
-
-            def get_column_0_data(self):
-                pass
-
-        column = Column("Fake", sources=[])
-        column.name = "fake"
-
-        # Test implied named callback found first
-        view = DummyNamed()
-        dt = Datatable([], "/", callback_target=view)
-        f = dt.get_processor_method(column, i=0)
-        self.assertEqual(f, view.get_column_fake_data)
-
-        # Test implied named callback found first
-        view = DummyIndexed()
-        dt = Datatable([], "/", callback_target=view)
-        f = dt.get_processor_method(column, i=0)
-        self.assertEqual(f, view.get_column_0_data)
-
-        # Test implied named callback found first
-        view = DummyBoth()
-        dt = Datatable([], "/", callback_target=view)
-        f = dt.get_processor_method(column, i=0)
-        self.assertEqual(f, view.get_column_fake_data)
-
-        class DTNamed(Datatable):
-            def get_column_fake_data(self):
-                pass
-
-        class DTIndexed(Datatable):
-            def get_column_0_data(self):
-                pass
-
-        class DTBoth(Datatable):
-            def get_column_fake_data(self):
-                pass
-
-            def get_column_0_data(self):
-                pass
-
-        # Test implied named callback found first
-        dt = DTNamed([], "/")
-        f = dt.get_processor_method(column, i=0)
-        self.assertEqual(f, dt.get_column_fake_data)
-
-        # Test implied named callback found first
-        dt = DTIndexed([], "/")
-        f = dt.get_processor_method(column, i=0)
-        self.assertEqual(f, dt.get_column_0_data)
 
-        # Test implied named callback found first
-        dt = DTBoth([], "/")
-        f = dt.get_processor_method(column, i=0)
-        self.assertEqual(f, dt.get_column_fake_data)
-
-    def test_iter_datatable_yields_columns(self):
-        class CustomColumn1(Column):
-            pass
-
-        class CustomColumn2(Column):
-            pass
-
-        class DT(Datatable):
-            fake1 = CustomColumn1("Fake1", sources=["get_absolute_url"])
-            fake2 = CustomColumn2("Fake2", sources=["get_absolute_url"])
-
-            class Meta:
-                model = ExampleModel
-                columns = ["name", "fake1", "fake2"]
-
-        dt = DT([], "/")
-        self.assertEqual(isgenerator(dt.__iter__()), True)
-        self.assertEqual(list(dt), [dt.columns["name"], dt.columns["fake1"], dt.columns["fake2"]])
+class SearchTests(DatatableViewTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.obj1 = ExampleModel.objects.create(name="test name 1", value=True)
+        cls.obj2 = ExampleModel.objects.create(name="test name 2", value=True)
+        cls.obj3 = ExampleModel.objects.create(name="test name 12", value=False)
 
     def test_search_term_basic(self):
-        obj1 = ExampleModel.objects.create(name="test name 1")
-        obj2 = ExampleModel.objects.create(name="test name 2")
-        obj3 = ExampleModel.objects.create(name="test name 12")
+        obj1, obj2, obj3 = self.obj1, self.obj2, self.obj3
         queryset = ExampleModel.objects.all()
 
-        class DT(Datatable):
-            class Meta:
-                model = ExampleModel
-                columns = ["name"]
-
-        dt = DT(queryset, "/", query_config={"search[value]": "test"})
-        dt.populate_records()
-        self.assertEqual(list(dt._records), [obj1, obj2, obj3])
-
-        dt = DT(queryset, "/", query_config={"search[value]": "name"})
-        dt.populate_records()
-        self.assertEqual(list(dt._records), [obj1, obj2, obj3])
-
-        dt = DT(queryset, "/", query_config={"search[value]": "1"})
-        dt.populate_records()
-        self.assertEqual(list(dt._records), [obj1, obj3])
-
-        dt = DT(queryset, "/", query_config={"search[value]": "2"})
-        dt.populate_records()
-        self.assertEqual(list(dt._records), [obj2, obj3])
-
-        dt = DT(queryset, "/", query_config={"search[value]": "12"})
-        dt.populate_records()
-        self.assertEqual(list(dt._records), [obj3])
-
-        dt = DT(queryset, "/", query_config={"search[value]": "3"})
-        dt.populate_records()
-        self.assertEqual(list(dt._records), [])
+        cases = [
+            ("test", [obj1, obj2, obj3]),
+            ("name", [obj1, obj2, obj3]),
+            ("1", [obj1, obj3]),
+            ("2", [obj2, obj3]),
+            ("12", [obj3]),
+            ("3", []),
+        ]
+        for term, expected in cases:
+            with self.subTest(term=term):
+                dt = NameDatatable(queryset, "/", query_config={"search[value]": term})
+                dt.populate_records()
+                self.assertQuerySetEqual(
+                    dt._records.values_list("pk", flat=True),
+                    [obj.pk for obj in expected],
+                    ordered=False,
+                )
 
     def test_search_term_boolean(self):
-        ExampleModel.objects.create(name="test name 1", value=True)
-        ExampleModel.objects.create(name="test name 2", value=True)
-        ExampleModel.objects.create(name="test name 12", value=False)
         queryset = ExampleModel.objects.all()
 
         class DT(Datatable):
@@ -683,60 +753,52 @@ class DatatableTests(DatatableViewTestCase):
                 model = ExampleModel
                 columns = ["name", "senior"]
 
-        dt = DT(queryset, "/", query_config={"search[value]": "True"})
-        dt.populate_records()
-        self.assertEqual(len(list(dt._records)), 2)
-
-        dt = DT(queryset, "/", query_config={"search[value]": "false"})
-        dt.populate_records()
-        self.assertEqual(len(list(dt._records)), 1)
-
-        dt = DT(queryset, "/", query_config={"search[value]": "SENIOR"})
-        dt.populate_records()
-        self.assertEqual(len(list(dt._records)), 2)
-
-        dt = DT(queryset, "/", query_config={"search[value]": "menior"})
-        dt.populate_records()
-        self.assertEqual(len(list(dt._records)), 0)
+        cases = [("True", 2), ("false", 1), ("SENIOR", 2), ("menior", 0)]
+        for term, expected_count in cases:
+            with self.subTest(term=term):
+                dt = DT(queryset, "/", query_config={"search[value]": term})
+                dt.populate_records()
+                self.assertEqual(len(list(dt._records)), expected_count)
 
     def test_search_multiple_terms_use_AND(self):
-        obj1 = ExampleModel.objects.create(name="test name 1")
-        obj2 = ExampleModel.objects.create(name="test name 2")
-        obj3 = ExampleModel.objects.create(name="test name 12")
+        obj1, obj2, obj3 = self.obj1, self.obj2, self.obj3
         queryset = ExampleModel.objects.all()
 
-        class DT(Datatable):
-            class Meta:
-                model = ExampleModel
-                columns = ["name"]
-
-        dt = DT(queryset, "/", query_config={"search[value]": "test name"})
-        dt.populate_records()
-        self.assertEqual(list(dt._records), [obj1, obj2, obj3])
-
-        dt = DT(queryset, "/", query_config={"search[value]": "test 1"})
-        dt.populate_records()
-        self.assertEqual(list(dt._records), [obj1, obj3])
-
-        dt = DT(queryset, "/", query_config={"search[value]": "test 2"})
-        dt.populate_records()
-        self.assertEqual(list(dt._records), [obj2, obj3])
-
-        dt = DT(queryset, "/", query_config={"search[value]": "test 12"})
-        dt.populate_records()
-        self.assertEqual(list(dt._records), [obj3])
-
-        dt = DT(queryset, "/", query_config={"search[value]": "test 3"})
-        dt.populate_records()
-        self.assertEqual(list(dt._records), [])
-
-    def test_search_term_queries_all_columns(self):
+        cases = [
+            ("test name", [obj1, obj2, obj3]),
+            ("test 1", [obj1, obj3]),
+            ("test 2", [obj2, obj3]),
+            ("test 12", [obj3]),
+            ("test 3", []),
+        ]
+        for term, expected in cases:
+            with self.subTest(term=term):
+                dt = NameDatatable(queryset, "/", query_config={"search[value]": term})
+                dt.populate_records()
+                self.assertQuerySetEqual(
+                    dt._records.values_list("pk", flat=True),
+                    [obj.pk for obj in expected],
+                    ordered=False,
+                )
+
+        # Every term is ANDed into the one filtered query
+        dt = NameDatatable(queryset, "/", query_config={"search[value]": "test name 12"})
+        dt.populate_records()
+        with self.assertNumQueries(1):
+            self.assertEqual(list(dt._records), [obj3])
+
+
+class RelatedSearchTests(DatatableViewTestCase):
+    @classmethod
+    def setUpTestData(cls):
         r1 = RelatedModel.objects.create(name="test related 1 one")
         r2 = RelatedModel.objects.create(name="test related 2 two")
-        obj1 = ExampleModel.objects.create(name="test name 1", related=r1)
-        obj2 = ExampleModel.objects.create(name="test name 2", related=r2)
+        cls.obj1 = ExampleModel.objects.create(name="test name 1", related=r1)
+        cls.obj2 = ExampleModel.objects.create(name="test name 2", related=r2)
 
-        queryset = ExampleModel.objects.all()
+    def test_search_term_queries_all_columns(self):
+        obj1, obj2 = self.obj1, self.obj2
+        queryset = ExampleModel.objects.select_related("related")
 
         class DT(Datatable):
             related = TextColumn("Related", ["related__name"])
@@ -745,41 +807,28 @@ class DatatableTests(DatatableViewTestCase):
                 model = ExampleModel
                 columns = ["name", "related"]
 
-        dt = DT(queryset, "/", query_config={"search[value]": "test"})
-        dt.populate_records()
-        self.assertEqual(list(dt._records), [obj1, obj2])
-
-        dt = DT(queryset, "/", query_config={"search[value]": "test name"})
-        dt.populate_records()
-        self.assertEqual(list(dt._records), [obj1, obj2])
-
-        dt = DT(queryset, "/", query_config={"search[value]": "test 2"})
-        dt.populate_records()
-        self.assertEqual(list(dt._records), [obj2])
-
-        dt = DT(queryset, "/", query_config={"search[value]": "related 2"})
-        dt.populate_records()
-        self.assertEqual(list(dt._records), [obj2])
-
-        dt = DT(queryset, "/", query_config={"search[value]": "test one"})
-        dt.populate_records()
-        self.assertEqual(list(dt._records), [obj1])
-
-        dt = DT(queryset, "/", query_config={"search[value]": "2 two"})
-        dt.populate_records()
-        self.assertEqual(list(dt._records), [obj2])
-
-        dt = DT(queryset, "/", query_config={"search[value]": "test three"})
-        dt.populate_records()
-        self.assertEqual(list(dt._records), [])
+        cases = [
+            ("test", [obj1, obj2]),
+            ("test name", [obj1, obj2]),
+            ("test 2", [obj2]),
+            ("related 2", [obj2]),
+            ("test one", [obj1]),
+            ("2 two", [obj2]),
+            ("test three", []),
+        ]
+        for term, expected in cases:
+            with self.subTest(term=term):
+                dt = DT(queryset, "/", query_config={"search[value]": term})
+                dt.populate_records()
+                self.assertQuerySetEqual(
+                    dt._records.values_list("pk", flat=True),
+                    [obj.pk for obj in expected],
+                    ordered=False,
+                )
 
     def test_search_term_queries_extra_fields(self):
-        r1 = RelatedModel.objects.create(name="test related 1 one")
-        r2 = RelatedModel.objects.create(name="test related 2 two")
-        obj1 = ExampleModel.objects.create(name="test name 1", related=r1)
-        obj2 = ExampleModel.objects.create(name="test name 2", related=r2)
-
-        queryset = ExampleModel.objects.all()
+        obj1, obj2 = self.obj1, self.obj2
+        queryset = ExampleModel.objects.select_related("related")
 
         class DT(Datatable):
             related = TextColumn("Related", ["related__name"])
@@ -799,9 +848,20 @@ class DatatableTests(DatatableViewTestCase):
 
 
 class ValuesDatatableTests(DatatableViewTestCase):
+    fixtures = ["test_data.json"]
+
     def test_get_object_pk(self):
-        obj1 = ExampleModel.objects.create(name="test name 1")
         queryset = ExampleModel.objects.all()
         dt = ValuesDatatable(queryset, "/")
-        obj_data = queryset.values("pk")[0]
-        self.assertEqual(dt.get_object_pk(obj_data), obj1.pk)
+        obj_data = queryset.values("pk").get(pk=1)
+        self.assertEqual(dt.get_object_pk(obj_data), 1)
+
+    def test_populate_records_selects_only_column_sources(self):
+        class DT(ValuesDatatable):
+            class Meta:
+                model = ExampleModel
+                columns = ["name"]
+
+        dt = DT(ExampleModel.objects.all(), "/")
+        dt.populate_records()
+        self.assertEqual(list(dt._records.query.values_select), ["pk", "name"])
@@ -2,7 +2,7 @@ from django.apps import apps
 
 from datatableview.columns import Column
 from .testcase import DatatableViewTestCase
-from datatableview.utils import get_first_orm_bit, resolve_orm_path
+from datatableview.utils import get_first_orm_bit, get_related_lookups, resolve_orm_path
 
 ExampleModel = apps.get_model("test_app", "ExampleModel")
 RelatedModel = apps.get_model("test_app", "RelatedModel")
@@ -35,3 +35,19 @@ class UtilsTests(DatatableViewTestCase):
         """Verify that ExampleModel->>>RelatedM2MModel.name == RelatedM2MModel.name"""
         remote_field = resolve_orm_path(ExampleModel, "relateds__name")
         self.assertEqual(remote_field, RelatedM2MModel._meta.get_field("name"))
+
+    def test_get_related_lookups(self):
+        """Verify that forward paths are joined and multi-valued paths are prefetched."""
+        select_related, prefetch_related = get_related_lookups(
+            ExampleModel,
+            [
+                "name",
+                "related",
+                "related__name",
+                "-relateds__name",
+                "reverserelatedmodel__name",
+                "get_absolute_url",
+            ],
+        )
+        self.assertEqual(select_related, ["related"])
+        self.assertEqual(prefetch_related, ["relateds", "reverserelatedmodel"])
@@ -1,9 +1,11 @@
+import datetime
 import json
+from unittest import mock
 
 from django.urls import reverse
 
-from example_app.views import ZeroConfigurationDatatableView
-from example_app.models import Entry
+from example_app.views import IndexView, ZeroConfigurationDatatableView
+from example_app.models import Blog, Entry
 from example_app.views import (
     BootstrapTemplateDatatableView,
     PrettyNamesDatatableView,
@@ -18,6 +20,9 @@ from example_app.views import (
     ManyToManyFieldsDatatableView,
 )
 
+from datatableview.datatables import Datatable
+from datatableview.views.base import _get_datatable_class, synthesize_datatable_class
+
 from .testcase import DatatableViewTestCase
 
 
@@ -47,6 +52,12 @@ class ViewsTests(DatatableViewTestCase):
         response = self.client.get(url)
         self.assertEqual(len(list(response.context["datatable"])), len(Entry._meta.local_fields))
 
+    def test_cached_structure_markup_varies_by_query_string(self):
+        """Verifies that a demo's cached table markup isn't served for another query string."""
+        url = reverse("zero-configuration")
+        self.assertContains(self.client.get(url), 'data-page-length="25"')
+        self.assertContains(self.client.get(url + "?length=50"), 'data-page-length="50"')
+
     def test_specific_columns_datatable_view(self):
         """Verifies that "columns" list matches context object length."""
         view = SpecificColumnsDatatableView()
@@ -70,6 +81,45 @@ class ViewsTests(DatatableViewTestCase):
             response.context["datatable"].columns["pub_date"].label, "Publication date"
         )
 
+    def test_index_view_checks_database_until_it_works(self):
+        """Verifies that the database is no longer probed once it has been found to work."""
+        # The probe result is process-wide, so start from a clean slate and restore it afterwards
+        patcher = mock.patch.object(IndexView, "db_works", False)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse("index"))
+        self.assertTrue(response.context["db_works"])
+        with self.assertNumQueries(0):
+            response = self.client.get(reverse("index"))
+        self.assertTrue(response.context["db_works"])
+
+    def test_synthesized_datatable_class_is_reused(self):
+        """Verifies that requests share one datatable class without sharing its configuration."""
+        url = reverse("specific-columns")
+        view = SpecificColumnsDatatableView()
+        view.request = FakeRequest(url)
+        view.request.GET = {"order[0][column]": "1", "order[0][dir]": "desc"}
+        datatable = view.get_datatable()
+        datatable.configure()
+        self.assertEqual(datatable.config["ordering"], ["-headline"])
+
+        other_view = SpecificColumnsDatatableView()
+        other_view.request = FakeRequest(url)
+        other_datatable = other_view.get_datatable()
+        other_datatable.configure()
+        self.assertIs(type(other_datatable), type(datatable))
+        self.assertEqual(other_datatable.config["ordering"], Entry._meta.ordering)
+
+    def test_synthesized_datatable_class_cache_is_bounded(self):
+        """Verifies that per-request option values can't grow the class cache without limit."""
+        maxsize = _get_datatable_class.cache_info().maxsize
+        self.assertIsNotNone(maxsize)
+        for i in range(maxsize + 10):
+            synthesize_datatable_class(Datatable, Entry, {"page_length": i})
+        self.assertEqual(_get_datatable_class.cache_info().currsize, maxsize)
+
     # def test_x_editable_columns_datatable_view(self):
     #     view = views.XEditableColumnsDatatableView
     #     url = reverse('x-editable-columns')
@@ -115,6 +165,42 @@ class ViewsTests(DatatableViewTestCase):
         demo3_obj = self.get_json_response(str(url) + "?datatable=demo3")
         self.assertEqual(len(demo3_obj["data"][0]), 3 + 2)  # 2 built-in DT items
 
+    def test_multiple_tables_datatable_view_getter_kinds(self):
+        """Verifies that staticmethod, classmethod and patched getters are all honored."""
+
+        class GetterKindsDatatableView(MultipleTablesDatatableView):
+            @staticmethod
+            def get_demo1_datatable_queryset():
+                return Entry.objects.filter(pk=1)
+
+            @classmethod
+            def get_demo3_datatable_queryset(cls):
+                return Blog.objects.filter(pk=1)
+
+            @classmethod
+            def get_demo2_datatable_kwargs(cls, **kwargs):
+                kwargs["columns"] = ["id"]
+                return kwargs
+
+        view = GetterKindsDatatableView()
+        view.request = FakeRequest(reverse("multiple-tables"))
+        view.kwargs = {}
+        datatables = view.get_datatables()
+        self.assertEqual(list(datatables["demo1"].object_list), [Entry.objects.get(pk=1)])
+        self.assertEqual(list(datatables["demo3"].object_list), [Blog.objects.get(pk=1)])
+        self.assertEqual(list(datatables["demo2"].columns), ["id"])
+
+        with mock.patch.object(
+            GetterKindsDatatableView,
+            "get_demo1_datatable_queryset",
+            return_value=Entry.objects.none(),
+        ):
+            view = GetterKindsDatatableView()
+            view.request = FakeRequest(reverse("multiple-tables"))
+            view.kwargs = {}
+            datatables = view.get_datatables(only="demo1")
+        self.assertEqual(list(datatables["demo1"].object_list), [])
+
     def test_embedded_table_datatable_view(self):
         view = SatelliteDatatableView()
         url = reverse("embedded-table")
@@ -123,6 +209,9 @@ class ViewsTests(DatatableViewTestCase):
         self.assertEqual(
             len(list(response.context["datatable"])), len(view.get_datatable().columns)
         )
+        # Each request renders its own datatable instance
+        other_response = self.client.get(url)
+        self.assertIsNot(other_response.context["datatable"], response.context["datatable"])
 
     # Straightforward views that call on procedural logic not worth testing.  We would effectively
     # be proving that Python strings concatenate, etc.
@@ -170,3 +259,74 @@ class ViewsTests(DatatableViewTestCase):
         view.request = FakeRequest(url)
         self.client.get(url)
         self.get_json_response(url)
+
+
+class QueryCountTests(DatatableViewTestCase):
+    """
+    Locks in the number of queries each AJAX response costs, so that a column walking a
+    relationship can't quietly reintroduce a query per row.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        # Enough blogs to fill a page of the Blog tables too
+        Blog.objects.bulk_create([Blog(name="Blog %d" % i, tagline="") for i in range(30)])
+        # Re-read, since bulk_create() doesn't set pks on every backend (MySQL)
+        blogs = list(Blog.objects.order_by("pk"))
+        today = datetime.date.today()
+        Entry.objects.bulk_create(
+            [
+                Entry(
+                    blog=blogs[i % len(blogs)],
+                    headline="Entry %d" % i,
+                    body_text="",
+                    pub_date=today,
+                    mod_date=today,
+                    n_comments=0,
+                    n_pingbacks=0,
+                    rating=0,
+                    status=0,
+                )
+                for i in range(50)
+            ]
+        )
+
+    def assertAjaxQueries(self, num, url):
+        # One count of the whole table and one query for the page of records
+        with self.assertNumQueries(num):
+            response = self.client.get(url, HTTP_X_REQUESTED_WITH="XMLHttpRequest")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(json.loads(response.content.decode())["data"]), 25)
+
+    def test_zero_configuration_datatable_view(self):
+        self.assertAjaxQueries(2, reverse("zero-configuration"))
+
+    def test_specific_columns_datatable_view(self):
+        self.assertAjaxQueries(2, reverse("specific-columns"))
+
+    def test_default_callback_names_datatable_view(self):
+        self.assertAjaxQueries(2, reverse("default-callback-names"))
+
+    def test_compound_columns_datatable_view(self):
+        self.assertAjaxQueries(2, reverse("compound-columns"))
+
+    def test_many_to_many_fields_datatable_view(self):
+        self.assertAjaxQueries(3, reverse("many-to-many-fields"))
+
+    def test_customized_template_datatable_view(self):
+        self.assertAjaxQueries(2, reverse("customized-template"))
+
+    def test_bootstrap_template_datatable_view(self):
+        self.assertAjaxQueries(2, reverse("bootstrap-template"))
+
+    def test_css_styling_datatable_view(self):
+        self.assertAjaxQueries(2, reverse("css-styling"))
+
+    def test_satellite_datatable_view(self):
+        self.assertAjaxQueries(2, reverse("satellite"))
+
+    def test_multiple_tables_datatable_view(self):
+        url = reverse("multiple-tables")
+        self.assertAjaxQueries(2, url + "?datatable=demo1")
+        self.assertAjaxQueries(2, url + "?datatable=demo2")
+        self.assertAjaxQueries(2, url + "?datatable=demo3")
@@ -1,5 +1,6 @@
 from functools import reduce
 
+from django.core.exceptions import FieldDoesNotExist
 from django.utils.text import smart_split
 
 MINIMUM_PAGE_LENGTH = 1
@@ -108,5 +109,40 @@ def contains_plural_field(model, fields):
     return False
 
 
+def get_related_lookups(model, fields):
+    """
+    Returns a 2-tuple of the relationship paths walked by the ORM paths in ``fields``, divided into
+    the lookups that can be joined with ``select_related()`` and those that involve multiple items
+    and must go through ``prefetch_related()``.  A path component that isn't a relationship ends
+    the walk, so plain fields and virtual sources don't contribute anything.
+
+    """
+
+    select_related = []
+    prefetch_related = []
+    source_model = model
+    for orm_path in fields:
+        model = source_model
+        bits = []
+        plural = False
+        for bit in orm_path.lstrip("+-").split("__"):
+            try:
+                field = model._meta.get_field(bit)
+            except FieldDoesNotExist:
+                break
+            if not field.is_relation or field.related_model is None:
+                break
+            bits.append(bit)
+            plural = plural or field.many_to_many or field.one_to_many
+            model = field.related_model
+        if not bits:
+            continue
+        lookups = prefetch_related if plural else select_related
+        lookup = "__".join(bits)
+        if lookup not in lookups:
+            lookups.append(lookup)
+    return select_related, prefetch_related
+
+
 def split_terms(s):
     return filter(None, map(lambda t: t.strip("'\" "), smart_split(s)))
@@ -1,5 +1,6 @@
 import json
 import logging
+from functools import lru_cache
 
 from django.views.generic import ListView, TemplateView
 from django.views.generic.list import MultipleObjectMixin
@@ -13,6 +14,57 @@ from ..datatables import Datatable
 log = logging.getLogger(__name__)
 
 
+def _build_datatable_class(datatable_class, options):
+    if datatable_class is None:
+
+        class AutoMeta:
+            pass
+
+        opts = AutoMeta()
+        datatable_class = Datatable
+    else:
+        opts = datatable_class.options_class(datatable_class._meta)
+
+    for meta_opt, value in options:
+        setattr(opts, meta_opt, value)
+
+    return type(
+        "%s_Synthesized" % (datatable_class.__name__,),
+        (datatable_class,),
+        {
+            "__module__": datatable_class.__module__,
+            "Meta": opts,
+        },
+    )
+
+
+# Bounded, since the options can come from per-request ``get_datatable_kwargs()`` values.
+_get_datatable_class = lru_cache(maxsize=128)(_build_datatable_class)
+
+
+def synthesize_datatable_class(datatable_class, model, kwargs):
+    """
+    Returns a subclass of ``datatable_class`` whose ``Meta`` takes on any options found in
+    ``kwargs``, which are popped so that they aren't also sent to the constructor.  If
+    ``datatable_class`` is None, a bare ``Datatable`` for ``model`` is used instead.
+
+    Declaring the subclass means running the metaclass's column discovery again, so the result is
+    reused for later calls with the same (hashable) options.
+    """
+    if datatable_class is None:
+        options = (("model", model),)
+    else:
+        meta_opts = datatable_class._meta.__dict__
+        options = tuple((name, kwargs.pop(name)) for name in meta_opts if name in kwargs)
+
+    try:
+        hash(options)
+    except TypeError:
+        # Lists or dicts given by the view, such as a ``columns`` attribute
+        return _build_datatable_class(datatable_class, options)
+    return _get_datatable_class(datatable_class, options)
+
+
 class DatatableJSONResponseMixin(object):
     def dispatch(self, request, *args, **kwargs):
         try:
@@ -103,29 +155,12 @@ class DatatableMixin(DatatableJSONResponseMixin, MultipleObjectMixin):
             return self._datatable
 
         datatable_class = self.get_datatable_class()
+        model = None
         if datatable_class is None:
-
-            class AutoMeta:
-                model = self.model or self.get_queryset().model
-
-            opts = AutoMeta()
-            datatable_class = Datatable
-        else:
-            opts = datatable_class.options_class(datatable_class._meta)
+            model = self.model or self.get_queryset().model
 
         kwargs = self.get_datatable_kwargs(**kwargs)
-        for meta_opt in opts.__dict__:
-            if meta_opt in kwargs:
-                setattr(opts, meta_opt, kwargs.pop(meta_opt))
-
-        datatable_class = type(
-            "%s_Synthesized" % (datatable_class.__name__,),
-            (datatable_class,),
-            {
-                "__module__": datatable_class.__module__,
-                "Meta": opts,
-            },
-        )
+        datatable_class = synthesize_datatable_class(datatable_class, model, kwargs)
         self._datatable = datatable_class(**kwargs)
         return self._datatable
 
@@ -195,7 +230,8 @@ class DatatableView(DatatableMixin, ListView):
 
 class MultipleDatatableMixin(DatatableJSONResponseMixin):
     """
-    Allow multiple Datatable classes to be given as a dictionary of context names to classes.
+    Allow multiple Datatable classes to be given as a dictionary of context names to classes, or as
+    a sequence of ``(name, class)`` pairs.
 
     Methods will be dynamically inspected to supply the classes with a queryset and their
     initialization kwargs, in the form of ``get_FOO_datatable_queryset(**kwargs)`` or
@@ -206,7 +242,23 @@ class MultipleDatatableMixin(DatatableJSONResponseMixin):
     came into the ``get_FOO_datatable_kwargs(**kwargs)`` method.
     """
 
-    datatable_classes = None  # Dict of context names to class names
+    datatable_classes = None  # Dict (or pairs) of context names to class names
+
+    def __init_subclass__(cls, **kwargs):
+        super(MultipleDatatableMixin, cls).__init_subclass__(**kwargs)
+        # Format each table's getter names once.  The methods themselves are still looked up on
+        # the instance per request, so staticmethods, classmethods and patched getters all work.
+        cls._datatable_getter_names = {
+            name: cls._get_datatable_getter_names(name)
+            for name in dict(cls.datatable_classes or {})
+        }
+
+    @staticmethod
+    def _get_datatable_getter_names(name):
+        return (
+            "get_%s_datatable_queryset" % (name,),
+            "get_%s_datatable_kwargs" % (name,),
+        )
 
     # AJAX response handler
     def get_ajax(self, request, *args, **kwargs):
@@ -240,7 +292,11 @@ class MultipleDatatableMixin(DatatableJSONResponseMixin):
             for name, datatable_class in datatable_classes.items():
                 if only and name != only:
                     continue
-                queryset_getter_name = "get_%s_datatable_queryset" % (name,)
+                getter_names = getattr(self, "_datatable_getter_names", {}).get(name)
+                if getter_names is None:
+                    # A name supplied at runtime by ``get_datatable_classes()``
+                    getter_names = self._get_datatable_getter_names(name)
+                queryset_getter_name, kwargs_getter_name = getter_names
                 queryset_getter = getattr(self, queryset_getter_name, None)
                 if queryset_getter is None:
                     raise ValueError(
@@ -249,39 +305,21 @@ class MultipleDatatableMixin(DatatableJSONResponseMixin):
                     )
 
                 queryset = queryset_getter()
-                if datatable_class is None:
-
-                    class AutoMeta:
-                        model = queryset.model
-
-                    opts = AutoMeta()
-                    datatable_class = Datatable
-                else:
-                    opts = datatable_class.options_class(datatable_class._meta)
-
                 kwargs = self.get_default_datatable_kwargs(object_list=queryset)
-                kwargs_getter_name = "get_%s_datatable_kwargs" % (name,)
                 kwargs_getter = getattr(self, kwargs_getter_name, None)
                 if kwargs_getter:
                     kwargs = kwargs_getter(**kwargs)
                 if "url" in kwargs:
-                    kwargs["url"] = kwargs["url"] + "?datatable=%s" % (name,)
-
-                for meta_opt in opts.__dict__:
-                    if meta_opt in kwargs:
-                        setattr(opts, meta_opt, kwargs.pop(meta_opt))
+                    kwargs["url"] += "?datatable=" + name
 
-                datatable_class = type(
-                    "%s_Synthesized" % (datatable_class.__name__,),
-                    (datatable_class,),
-                    {"__module__": datatable_class.__module__, "Meta": opts},
+                datatable_class = synthesize_datatable_class(
+                    datatable_class, queryset.model, kwargs
                 )
-
                 self._datatables[name] = datatable_class(**kwargs)
         return self._datatables
 
     def get_datatable_classes(self):
-        """Return a shallow copy of the view's ``datatable_classes`` dict."""
+        """Return the view's ``datatable_classes`` as a new dict."""
         if self.datatable_classes is None:
             return {}
         return dict(self.datatable_classes)
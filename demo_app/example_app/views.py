@@ -1,18 +1,26 @@
+from functools import lru_cache
 from os import sep
 import os.path
 import re
+import textwrap
 import django
+from django.core.exceptions import FieldDoesNotExist
+from django.db import DatabaseError
+from django.db.models import Prefetch
 from django.urls import reverse
 from django.views.generic import View, TemplateView
 from django.template.defaultfilters import timesince
+from django.utils.html import linebreaks
+from django.utils.safestring import mark_safe
 
 import datatableview
 from datatableview import Datatable, ValuesDatatable, columns, SkipRecord
 from datatableview.views import DatatableView, MultipleDatatableView, XEditableDatatableView
 from datatableview.views.legacy import LegacyDatatableView
 from datatableview import helpers
+from datatableview.utils import contains_plural_field, get_related_lookups, resolve_orm_path
 
-from .models import Entry, Blog
+from .models import Entry, Blog, Author
 
 
 class ResetView(View):
@@ -27,32 +35,41 @@ class ResetView(View):
         return HttpResponse("Done.")
 
 
+# The process doesn't change directories while serving, so there's no need to ask on every request.
+_WORKING_DIRECTORY = os.path.basename(os.getcwd())
+
+# Likewise for the installed versions shown on the index page.
+_VERSIONS = {
+    "datatableview_version": ".".join(map(str, datatableview.__version_info__)),
+    "django_version": django.get_version(),
+    "datatables_version": "1.10.9",
+}
+
+
 class IndexView(TemplateView):
     template_name = "index.html"
 
+    # Set once the database has answered; a working database doesn't need to be checked again.
+    db_works = False
+
     def get_context_data(self, **kwargs):
         context = super(IndexView, self).get_context_data(**kwargs)
 
         # Try to determine if the user jumped the gun on testing things out
-        db_works = True
-        try:
-            list(Entry.objects.all()[:1])
-        except Exception:
-            db_works = False
-        context["db_works"] = db_works
+        if not IndexView.db_works:
+            try:
+                Entry.objects.exists()
+            except DatabaseError:
+                pass
+            else:
+                IndexView.db_works = True
+        context["db_works"] = IndexView.db_works
 
-        path, working_directory = os.path.split(os.path.abspath("."))
-        context["working_directory"] = working_directory
+        context["working_directory"] = _WORKING_DIRECTORY
         context["os_sep"] = sep
 
         # Versions
-        context.update(
-            {
-                "datatableview_version": ".".join(map(str, datatableview.__version_info__)),
-                "django_version": django.get_version(),
-                "datatables_version": "1.10.9",
-            }
-        )
+        context.update(_VERSIONS)
 
         return context
 
@@ -69,43 +86,136 @@ class ValidColumnFormatsView(TemplateView):
     template_name = "valid_column_formats.html"
 
 
+_CAMEL_RE = re.compile(r"([a-z]|[A-Z]+)(?=[A-Z])")
+_DEDENT_RE = re.compile(r"^ {4}", re.M)
+_PARAGRAPH_SPLIT_RE = re.compile(r"\n\s*\n")
+_CODE_RE = re.compile(r"``(.*?)``")
+_ALERT_TYPES = {"info", "warning", "danger"}
+
+
+def _build_description(docstring):
+    """
+    Unwraps the lines of a demo's docstring so that they don't linebreak funny after being put
+    through the ``linebreaks`` template filter.
+    """
+    paragraphs = []
+    for paragraph in _PARAGRAPH_SPLIT_RE.split(_DEDENT_RE.sub("", docstring).strip()):
+        # A paragraph led by a line such as "INFO:" is wrapped up as an alert box.
+        p = []
+        alert = False
+        for line in paragraph.splitlines():
+            line = line.rstrip()
+            if line.lower()[:-1] in _ALERT_TYPES:
+                p.append("""<div class="alert alert-{type}">""".format(type=line.lower()[:-1]))
+                alert = True
+            else:
+                p.append(line)
+        if alert:
+            p.append("""</div>""")
+        if p:
+            paragraphs.append(" ".join(p))
+    description = "\n\n".join(paragraphs)
+    return _CODE_RE.sub(r"<code>\1</code>", description)
+
+
 class DemoMixin(object):
     description = """Missing description!"""
     implementation = """Missing implementation details!"""
 
+    def __init_subclass__(cls, **kwargs):
+        # Every demo is declared at import time, so its template names and the final markup for its
+        # description and implementation are worked out once here instead of on each request.
+        super(DemoMixin, cls).__init_subclass__(**kwargs)
+        name = _CAMEL_RE.sub(r"\1_", cls.__name__.replace("DatatableView", ""))
+        cls._template_names = ["demos/" + name.lower() + ".html", "example_base.html"]
+        cls._description = mark_safe(linebreaks(_build_description(cls.__doc__ or "")))
+        cls._implementation = mark_safe(textwrap.dedent(cls.implementation))
+
+    def get_queryset(self):
+        # Page through the rows in a deterministic order that the pk index can serve
+        return super(DemoMixin, self).get_queryset().order_by("pk")
+
     def get_template_names(self):
         """Try the view's snake_case name, or else use default simple template."""
-        name = self.__class__.__name__.replace("DatatableView", "")
-        name = re.sub(r"([a-z]|[A-Z]+)(?=[A-Z])", r"\1_", name)
-        return ["demos/" + name.lower() + ".html", "example_base.html"]
+        return list(self._template_names)
 
     def get_context_data(self, **kwargs):
         context = super(DemoMixin, self).get_context_data(**kwargs)
-        context["implementation"] = self.implementation
+        context["implementation"] = self._implementation
+        context["description"] = self._description
+        return context
 
-        # Unwrap the lines of description text so that they don't linebreak funny after being put
-        # through the ``linebreaks`` template filter.
-        alert_types = ["info", "warning", "danger"]
-        paragraphs = []
-        p = []
-        alert = False
-        for line in self.__doc__.splitlines():
-            line = line[4:].rstrip()
-            if not line:
-                if alert:
-                    p.append("""</div>""")
-                    alert = False
-                paragraphs.append(p)
-                p = []
-            elif line.lower()[:-1] in alert_types:
-                p.append("""<div class="alert alert-{type}">""".format(type=line.lower()[:-1]))
-                alert = True
-            else:
-                p.append(line)
-        description = "\n\n".join(" ".join(p) for p in paragraphs)
-        context["description"] = re.sub(r"``(.*?)``", r"<code>\1</code>", description)
 
-        return context
+def _column_sources(datatable_class, model):
+    """
+    Returns the ORM paths that the columns of ``datatable_class`` read from, including the plain
+    field names listed in ``Meta.columns`` that haven't been turned into columns yet.  Tables that
+    don't name their columns fall back to the model's local fields, as the datatable itself does.
+    """
+    if datatable_class is None or datatable_class._meta.columns is None:
+        return [field.name for field in model._meta.local_fields]
+    sources = [name for name in datatable_class._meta.columns if isinstance(name, str)]
+    for column in datatable_class.base_columns.values():
+        if column is None:
+            continue
+        for source in column.sources:
+            sources.extend(s for s in column.expand_source(source) if isinstance(s, str))
+    return sources
+
+
+def _related_queryset(queryset, datatable_class):
+    """
+    Adds the ``select_related()`` and ``prefetch_related()`` lookups for the relationships that the
+    columns of ``datatable_class`` walk while rendering each row.
+    """
+    sources = _column_sources(datatable_class, queryset.model)
+    select_related, prefetch_related = get_related_lookups(queryset.model, sources)
+    if select_related:
+        queryset = queryset.select_related(*select_related)
+    if prefetch_related:
+        queryset = queryset.prefetch_related(*prefetch_related)
+    return queryset
+
+
+def _projected_queryset(queryset, datatable_class):
+    """
+    Restricts ``queryset`` to the model fields that the columns of ``datatable_class`` read, on top
+    of the joins added by ``_related_queryset()``.
+    """
+    fields = []
+    for source in _column_sources(datatable_class, queryset.model):
+        try:
+            field = resolve_orm_path(queryset.model, source)
+        except (FieldDoesNotExist, ValueError):
+            continue
+        if field.many_to_many or field.one_to_many:
+            continue
+        if not contains_plural_field(queryset.model, [source]):
+            fields.append(source)
+    return _related_queryset(queryset, datatable_class).only(*fields)
+
+
+class RelatedQuerysetMixin(object):
+    """
+    Joins in the relationships that a demo's datatable columns walk, such as the ``blog`` foreign
+    key, so that rendering a page doesn't cost an extra query per row.
+    """
+
+    def get_queryset(self):
+        queryset = super(RelatedQuerysetMixin, self).get_queryset()
+        return _related_queryset(queryset, self.get_datatable_class())
+
+
+class ProjectedQuerysetMixin(object):
+    """
+    Restricts a demo's queryset to the model fields its datatable columns read, joining in the
+    relationships they walk.  Only suitable for tables whose processors don't reach for any other
+    fields, since each of those would cost a query per row.
+    """
+
+    def get_queryset(self):
+        queryset = super(ProjectedQuerysetMixin, self).get_queryset()
+        return _projected_queryset(queryset, self.get_datatable_class())
 
 
 # Configuration strategies
@@ -275,7 +385,7 @@ class ConfigureDatatableOptions(DemoMixin, LegacyDatatableView):
 
 
 # Column configurations
-class ZeroConfigurationDatatableView(DemoMixin, DatatableView):
+class ZeroConfigurationDatatableView(DemoMixin, RelatedQuerysetMixin, DatatableView):
     """
     If no columns are specified by the view's ``Datatable`` configuration object (or no
     ``datatable_class`` is given at all), ``DatatableView`` will use all of the model's local
@@ -299,7 +409,7 @@ class ZeroConfigurationDatatableView(DemoMixin, DatatableView):
     """
 
 
-class SpecificColumnsDatatableView(DemoMixin, DatatableView):
+class SpecificColumnsDatatableView(DemoMixin, ProjectedQuerysetMixin, DatatableView):
     """
     To target specific columns that should appear on the table, use the ``columns`` configuration
     option.  Specify a tuple or list of model field names, in the order that they are to appear on
@@ -333,7 +443,7 @@ class SpecificColumnsDatatableView(DemoMixin, DatatableView):
     """
 
 
-class PrettyNamesDatatableView(DemoMixin, DatatableView):
+class PrettyNamesDatatableView(DemoMixin, ProjectedQuerysetMixin, DatatableView):
     """
     As with the Django forms framework, verbose names can be given or overridden via the ``labels``
     configuration option, which is a dict mapping the column name to the desired string.  In this
@@ -363,7 +473,7 @@ class PrettyNamesDatatableView(DemoMixin, DatatableView):
     """
 
 
-class CustomColumnsDatatableView(DemoMixin, DatatableView):
+class CustomColumnsDatatableView(DemoMixin, RelatedQuerysetMixin, DatatableView):
     """
     As in the Django forms framework, extra columns can be added to a ``Datatable`` by defining them
     directly on the class, and then adding that column's name into the Meta ``columns`` list.  (With
@@ -449,7 +559,7 @@ class CustomColumnsDatatableView(DemoMixin, DatatableView):
     """
 
 
-class ColumnBackedByMethodDatatableView(DemoMixin, DatatableView):
+class ColumnBackedByMethodDatatableView(DemoMixin, RelatedQuerysetMixin, DatatableView):
     """
     Model methods and properties can also be given in a column's ``sources`` list, not just real
     model field names.  If the source is resolved on the model to be a callable method, it will be
@@ -489,7 +599,7 @@ class ColumnBackedByMethodDatatableView(DemoMixin, DatatableView):
     """
 
 
-class ProcessorsDatatableView(DemoMixin, DatatableView):
+class ProcessorsDatatableView(DemoMixin, RelatedQuerysetMixin, DatatableView):
     """
     After the column data is fetched from the database, but before it is serialized to JSON, each
     column can be sent to a processor callback.
@@ -563,7 +673,7 @@ class ProcessorsDatatableView(DemoMixin, DatatableView):
     """
 
 
-class CompoundColumnsDatatableView(DemoMixin, DatatableView):
+class CompoundColumnsDatatableView(DemoMixin, ProjectedQuerysetMixin, DatatableView):
     """
     Simple columns only need one model field to represent their data, even when marked up by a
     processor function.  However, if a column actually represents more than one model field the
@@ -645,7 +755,7 @@ class CompoundColumnsDatatableView(DemoMixin, DatatableView):
             columns = ['id', 'headline']
 
         def get_headline_data(self, instance, **kwargs):
-            return "%s (%s)" % (instance.headline, instance.blog.name)
+            return f"{instance.headline} ({instance.blog.name})"
 
     class CompoundColumnDatatableView(DatatableView):
         datatable_class = MyDatatable
@@ -665,6 +775,10 @@ class ManyToManyFieldsDatatableView(DemoMixin, DatatableView):
     that is the only visible data we are displaying in each column.  The ``processor`` callback
     receives the actual row instance and can look up the full authors queryset (including pk for use
     in url ``reverse()``).
+
+    Since each processor walks ``instance.authors.all()``, the view's ``get_queryset()`` should
+    call ``prefetch_related()`` for the relationship to avoid an extra query per row.  A
+    ``Prefetch`` object can narrow that single query down to the author fields actually displayed.
     """
 
     model = Entry
@@ -681,10 +795,15 @@ class ManyToManyFieldsDatatableView(DemoMixin, DatatableView):
             columns = ["id", "headline", "author_names_text", "author_names_links"]
 
         def get_author_names(self, instance, *args, **kwargs):
-            return ", ".join([author.name for author in instance.authors.all()])
+            return ", ".join(author.name for author in instance.authors.all())
 
         def get_author_names_as_links(self, instance, *args, **kwargs):
-            return ", ".join([helpers.link_to_model(author) for author in instance.authors.all()])
+            return ", ".join(helpers.link_to_model(author) for author in instance.authors.all())
+
+    def get_queryset(self):
+        return Entry.objects.prefetch_related(
+            Prefetch("authors", queryset=Author.objects.only("name"))
+        ).order_by("pk")
 
     implementation = """
     class MyDatatable(Datatable):
@@ -695,19 +814,24 @@ class ManyToManyFieldsDatatableView(DemoMixin, DatatableView):
             columns = ['id', 'headline', 'author_names_text', 'author_names_links']
 
         def get_author_names(self, instance, *args, **kwargs):
-            return ", ".join([author.name for author in instance.authors.all()])
+            return ", ".join(author.name for author in instance.authors.all())
 
         def get_author_names_as_links(self, instance, *args, **kwargs):
             from datatableview import helpers
-            return ", ".join([helpers.link_to_model(author) for author in instance.authors.all()])
+            return ", ".join(helpers.link_to_model(author) for author in instance.authors.all())
 
     class ManyToManyFields(DatatableView):
         model = Entry
         datatable_class = MyDatatable
+
+        def get_queryset(self):
+            return Entry.objects.prefetch_related(
+                Prefetch('authors', queryset=Author.objects.only('name'))
+            ).order_by('pk')
     """
 
 
-class DefaultCallbackNamesDatatableView(DemoMixin, LegacyDatatableView):
+class DefaultCallbackNamesDatatableView(DemoMixin, RelatedQuerysetMixin, LegacyDatatableView):
     """
     WARNING:
     Implicit callbacks are a concept from version 0.8 and earlier.  The example here is shown using
@@ -762,7 +886,7 @@ class DefaultCallbackNamesDatatableView(DemoMixin, LegacyDatatableView):
     """
 
 
-class XEditableColumnsDatatableView(DemoMixin, XEditableDatatableView):
+class XEditableColumnsDatatableView(DemoMixin, RelatedQuerysetMixin, XEditableDatatableView):
     """
     The <a href="http://vitalets.github.io/x-editable/">x-editable</a> javascript tool is a way to
     turn table cells into interactive forms that can post incremental updates over ajax.  x-editable
@@ -826,7 +950,7 @@ class XEditableColumnsDatatableView(DemoMixin, XEditableDatatableView):
     """
 
 
-class ColumnsReferenceDatatableView(DemoMixin, DatatableView):
+class ColumnsReferenceDatatableView(DemoMixin, RelatedQuerysetMixin, DatatableView):
     """
     ``Column`` classes handle the rendering of a value into a JSON-ready value, and are responsible
     for responding to search and sort queries on itself, so it is still important to match model
@@ -852,7 +976,19 @@ class ColumnsReferenceDatatableView(DemoMixin, DatatableView):
     implementation = """"""
 
 
-class HelpersReferenceDatatableView(DemoMixin, XEditableDatatableView):
+# Helper callbacks built once and shared, rather than being rebuilt as closures in the class body.
+_LINK_TO_BLOG = helpers.link_to_model(key=lambda obj: obj.blog)
+_TRUNCATE_BODY = helpers.itemgetter(slice(0, 30))
+_FORMAT_PUB_DATE = helpers.format_date("%A, %b %d, %Y")
+_FORMAT_THOUSANDS = helpers.format("{0:,}")
+
+
+def _age(instance, **kwargs):
+    # Called directly instead of through helpers.through_filter(), skipping a wrapper per cell
+    return timesince(instance.pub_date)
+
+
+class HelpersReferenceDatatableView(DemoMixin, RelatedQuerysetMixin, XEditableDatatableView):
     """
     ``datatableview.helpers`` is a module decimated to functions that can be supplied directly as
     column callback functions.  Some of them are easy to use at runtime in your own callbacks,
@@ -866,9 +1002,7 @@ class HelpersReferenceDatatableView(DemoMixin, XEditableDatatableView):
         blog_name = columns.TextColumn(
             "Blog name", sources=["blog__name"], processor=helpers.link_to_model
         )
-        age = columns.TextColumn(
-            "Age", sources=["pub_date"], processor=helpers.through_filter(timesince)
-        )
+        age = columns.TextColumn("Age", sources=["pub_date"], processor=_age)
         interaction = columns.IntegerColumn(
             "Interaction",
             sources=["get_interaction_total"],
@@ -890,12 +1024,12 @@ class HelpersReferenceDatatableView(DemoMixin, XEditableDatatableView):
             ]
             processors = {
                 "id": helpers.link_to_model,
-                "blog_name": helpers.link_to_model(key=lambda obj: obj.blog),
+                "blog_name": _LINK_TO_BLOG,
                 "headline": helpers.make_xeditable,
-                "body_text": helpers.itemgetter(slice(0, 30)),
-                "pub_date": helpers.format_date("%A, %b %d, %Y"),
-                "n_comments": helpers.format("{0:,}"),
-                "n_pingbacks": helpers.format("{0:,}"),
+                "body_text": _TRUNCATE_BODY,
+                "pub_date": _FORMAT_PUB_DATE,
+                "n_comments": _FORMAT_THOUSANDS,
+                "n_pingbacks": _FORMAT_THOUSANDS,
             }
 
     implementation = """
@@ -1131,10 +1265,10 @@ class MultipleTablesDatatableView(DemoMixin, MultipleDatatableView):
     <a href="/embedded-table/">Embdedded on another view</a> for an example of that pattern.)
 
     To get started, instead of declaring a ``datatable_class`` attribute on the view, you will
-    instead declare a ``datatable_classes`` dict.  This is a map of names to classes.  These names
-    will have ``"_datatable"`` added to the end when the datatable objects are added to the template
-    rendering context.  Consequently, you do not need to declare the normal
-    ``context_datatable_name`` setting on the view.
+    instead declare ``datatable_classes``, either as a dict or as a sequence of ``(name, class)``
+    pairs.  This is a map of names to classes.  These names will have ``"_datatable"`` added to the
+    end when the datatable objects are added to the template rendering context.  Consequently, you
+    do not need to declare the normal ``context_datatable_name`` setting on the view.
 
     This version of the view does not behave exactly like a ListView, specifically in the case of
     referencing the ``get_queryset()`` method you're accustomed to using.  Instead, you will need
@@ -1180,27 +1314,27 @@ class MultipleTablesDatatableView(DemoMixin, MultipleDatatableView):
             model = Blog
             columns = ["id", "name", "tagline"]
 
-    datatable_classes = {
-        "demo1": datatable_class,
-        "demo2": datatable_class,
-        "demo3": blog_datatable_class,
-    }
+    datatable_classes = (
+        ("demo1", datatable_class),
+        ("demo2", datatable_class),
+        ("demo3", blog_datatable_class),
+    )
+
+    # Demo #2 drops the "id" column; the slice is taken once here rather than on every request.
+    demo2_columns = tuple(datatable_class._meta.columns[1:])
 
     def get_demo1_datatable_queryset(self):
-        return Entry.objects.all()
+        return _projected_queryset(Entry.objects.order_by("pk"), self.datatable_class)
 
     def get_demo2_datatable_queryset(self):
-        return Entry.objects.all()
+        return _projected_queryset(Entry.objects.order_by("pk"), self.datatable_class)
 
     def get_demo3_datatable_queryset(self):
-        return Blog.objects.all()
+        return _projected_queryset(Blog.objects.order_by("pk"), self.blog_datatable_class)
 
-    def get_datatables(self, only=None):
-        datatables = super(MultipleTablesDatatableView, self).get_datatables(only)
-        if only in (None, "demo2"):
-            demo2 = datatables["demo2"]
-            del demo2.columns["id"]
-        return datatables
+    def get_demo2_datatable_kwargs(self, **kwargs):
+        kwargs["columns"] = self.demo2_columns
+        return kwargs
 
     implementation = """
     # Demo #1 and Demo #2 will use variations of the same options.
@@ -1216,27 +1350,24 @@ class MultipleTablesDatatableView(DemoMixin, MultipleDatatableView):
             columns = ['id', 'name', 'tagline']
 
     class MultipleTablesDatatableView(MultipleDatatableView):
-        datatable_classes = {
-            'demo1': EntryDatatable,
-            'demo2': EntryDatatable,
-            'demo3': BlogDatatable,
-        }
+        datatable_classes = (
+            ('demo1', EntryDatatable),
+            ('demo2', EntryDatatable),
+            ('demo3', BlogDatatable),
+        )
 
         def get_demo1_datatable_queryset(self):
-            return Entry.objects.all()
+            return Entry.objects.order_by('pk')
 
         def get_demo2_datatable_queryset(self):
-            return Entry.objects.all()
+            return Entry.objects.order_by('pk')
 
         def get_demo3_datatable_queryset(self):
-            return Blog.objects.all()
+            return Blog.objects.order_by('pk')
 
-        def get_datatables(self, only=None):
-            datatables = super(MultipleTablesDatatableView, self).get_datatables(only)
-            if only in (None, 'demo2'):
-                demo2 = datatables['demo2']
-                del demo2.columns['id']
-            return datatables
+        def get_demo2_datatable_kwargs(self, **kwargs):
+            kwargs['columns'] = ['headline']
+            return kwargs
     """
 
 
@@ -1258,6 +1389,8 @@ class EmbeddedTableDatatableView(DemoMixin, TemplateView):
 
     def get_context_data(self, **kwargs):
         context = super(EmbeddedTableDatatableView, self).get_context_data(**kwargs)
+        # A fresh datatable per request; its url and synthesized class are already cached, and
+        # the instance is mutated by configure() when it renders.
         context["datatable"] = SatelliteDatatableView().get_datatable()
         return context
 
@@ -1274,7 +1407,7 @@ class EmbeddedTableDatatableView(DemoMixin, TemplateView):
         \"\"\"
         template_name = "blank.html"
         model = Entry
-        class datatable_class(Datatable):
+        class datatable_class(ValuesDatatable):
             class Meta:
                 columns = ['id', 'headline', 'pub_date']
 
@@ -1285,6 +1418,11 @@ class EmbeddedTableDatatableView(DemoMixin, TemplateView):
     """
 
 
+@lru_cache(maxsize=1)
+def _satellite_url():
+    return reverse("satellite")
+
+
 class SatelliteDatatableView(DatatableView):
     """
     External view powering the embedded table for ``EmbeddedTableDatatableView``.
@@ -1292,18 +1430,21 @@ class SatelliteDatatableView(DatatableView):
 
     template_name = "blank.html"
     model = Entry
+    queryset = Entry.objects.order_by("pk")
 
-    class datatable_class(Datatable):
+    # Every column is a plain model field, so rows can come straight from ``values()`` without
+    # building ``Entry`` instances.
+    class datatable_class(ValuesDatatable):
         class Meta:
             columns = ["id", "headline", "pub_date"]
 
     def get_datatable_kwargs(self):
         kwargs = super(SatelliteDatatableView, self).get_datatable_kwargs()
-        kwargs["url"] = reverse("satellite")
+        kwargs["url"] = _satellite_url()
         return kwargs
 
 
-class SkippedRecordDatatableView(DemoMixin, DatatableView):
+class SkippedRecordDatatableView(DemoMixin, ProjectedQuerysetMixin, DatatableView):
     """
     WARNING:
     Avoid this.
@@ -1360,7 +1501,7 @@ class SkippedRecordDatatableView(DemoMixin, DatatableView):
 
 
 # Extension support
-class ColReorderDatatableView(DemoMixin, DatatableView):
+class ColReorderDatatableView(DemoMixin, ProjectedQuerysetMixin, DatatableView):
     """
     The official <a href="https://datatables.net/extensions/colreorder/">``ColReorder``
     extension</a> is easy to add to any existing table.  To use it, make sure you include the
@@ -1383,7 +1524,7 @@ class ColReorderDatatableView(DemoMixin, DatatableView):
     implementation = """dummy"""  # don't hide the block, overridden in template
 
 
-class MultiFilterDatatableView(DemoMixin, DatatableView):
+class MultiFilterDatatableView(DemoMixin, ProjectedQuerysetMixin, DatatableView):
     """
     The official <a href="http://datatables.net/examples/api/multi_filter.html">per-column
     searching</a> API is supported on the server if you can arrange for your client table to display
@@ -1410,7 +1551,7 @@ class MultiFilterDatatableView(DemoMixin, DatatableView):
     implementation = """dummy"""  # don't hide the block, overridden in template
 
 
-class SelectRowDatatableView(DemoMixin, DatatableView):
+class SelectRowDatatableView(DemoMixin, ProjectedQuerysetMixin, DatatableView):
     """
     The official <a href="https://datatables.net/extensions/select/">``Select``
     extension</a> is easy to add to any existing table.  To use it, make sure you include the
@@ -1434,7 +1575,7 @@ class SelectRowDatatableView(DemoMixin, DatatableView):
 
 
 # Template rendering
-class CustomizedTemplateDatatableView(DemoMixin, DatatableView):
+class CustomizedTemplateDatatableView(DemoMixin, ProjectedQuerysetMixin, DatatableView):
     """
     When the ``datatable`` context variable is rendered, it looks for a template named
     ``"datatableview/default_structure.html"``.  This template is pretty generic, but lacks special
@@ -1471,7 +1612,7 @@ class CustomizedTemplateDatatableView(DemoMixin, DatatableView):
     """
 
 
-class BootstrapTemplateDatatableView(DemoMixin, DatatableView):
+class BootstrapTemplateDatatableView(DemoMixin, ProjectedQuerysetMixin, DatatableView):
     """
     The easiest way to get Bootstrap datatables is to use the alternate structural template
     ``datatableview/bootstrap_structure.html``, which simply adds the
@@ -1522,7 +1663,7 @@ class BootstrapTemplateDatatableView(DemoMixin, DatatableView):
     """
 
 
-class CSSStylingDatatableView(DemoMixin, DatatableView):
+class CSSStylingDatatableView(DemoMixin, ProjectedQuerysetMixin, DatatableView):
     """
     The default template used by the datatable context variable when you render it will include
     ``data-name`` attributes on the ``&lt;th&gt;`` column headers, which is the ``slugify``'d